@@ -3,6 +3,8 @@ import requests
 from langchain_core.runnables import Runnable
 from app.core.config import settings
 from app.analyze.services.state_manager import state_manager
+from app.analyze.services.caption_cache import caption_cache
+from app.analyze.services.youtube_metadata_service import youtube_metadata_service
 from app.s3.services.user_s3_service import user_s3_service
 from app.decorators import track_youtube_job, track_api_performance
 import logging
@@ -14,6 +16,7 @@ class CaptionAgent(Runnable):
     def __init__(self):
         self.api_key = settings.VIDCAP_API_KEY
         self.api_url = "https://vidcap.xyz/api/v1/youtube/caption"
+        self.locale = "ko"
 
     @track_youtube_job("caption_extraction")
     @track_api_performance("/analyze/caption")
@@ -32,17 +35,26 @@ class CaptionAgent(Runnable):
                 logger.warning(f"진행률 업데이트 실패 (무시됨): {e}")
 
         try:
-            response = requests.get(
-                self.api_url,
-                params={"url": youtube_url, "locale": "ko"},
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=30  # 타임아웃 추가
-            )
-            response.raise_for_status()
+            video_id = youtube_metadata_service.extract_video_id(youtube_url)
 
-            caption = response.json().get("data", {}).get("content", "")
-            if not caption:
-                caption = "자막을 찾을 수 없습니다."
+            # 같은 영상을 최근에 분석했다면 외부 API 호출 생략
+            caption = caption_cache.get(video_id, self.locale)
+            if caption:
+                logger.info(f"⚡ 자막 캐시 적중: {video_id} ({len(caption)}자)")
+            else:
+                response = requests.get(
+                    self.api_url,
+                    params={"url": youtube_url, "locale": self.locale},
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    timeout=30  # 타임아웃 추가
+                )
+                response.raise_for_status()
+
+                caption = response.json().get("data", {}).get("content", "")
+                if caption:
+                    caption_cache.set(video_id, self.locale, caption)
+                else:
+                    caption = "자막을 찾을 수 없습니다."
 
             # 자막을 S3에 .txt 파일로 저장
             if job_id and user_id and caption != "자막을 찾을 수 없습니다.":
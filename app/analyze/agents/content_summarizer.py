@@ -1,29 +1,28 @@
 # app/agents/summary_agent.py
 import os
-import boto3
-from langchain_aws import ChatBedrock
+import time
+from typing import List
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 from app.core.config import settings
-from app.analyze.services.state_manager import state_manager
+from app.core.bedrock_registry import get_chat_model
+from app.core.llm_cache import lookup_chat_text, update_chat_text
+from app.analyze.services.state_manager import state_manager, JobCancelledError
+from app.analyze.services.summary_stream import summary_stream
 from app.decorators import track_llm_call
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class SummaryAgent(Runnable):
-    """YouTube 영상을 포괄적으로 요약하는 에이전트 - taeho 백엔드 통합 버전"""
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한글 등 비 ASCII 문자는 1자≈1토큰, ASCII는 4자≈1토큰)"""
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return (len(text) - ascii_chars) + ascii_chars // 4
 
-    def __init__(self):
-        self.llm = ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-            model=settings.BEDROCK_MODEL_ID,
-            model_kwargs={"temperature": settings.BEDROCK_TEMPERATURE, "max_tokens": settings.BEDROCK_MAX_TOKENS}
-        )
 
-        self.prompt = ChatPromptTemplate.from_messages([
-            ("system", """당신은 YouTube 영상 자막을 분석하여 **영상을 보지 않고도 완전히 이해할 수 있는** 포괄적인 요약을 생성하는 전문가입니다.
+SUMMARY_SYSTEM_PROMPT = """당신은 YouTube 영상 자막을 분석하여 **영상을 보지 않고도 완전히 이해할 수 있는** 포괄적인 요약을 생성하는 전문가입니다.
 
 **핵심 원칙:**
 1. **완전성**: 영상의 모든 중요한 내용을 포함하여, 독자가 영상을 보지 않아도 전체 내용을 이해할 수 있도록 합니다.
@@ -38,10 +37,46 @@ class SummaryAgent(Runnable):
 3. **세부 사항**: 중요한 팁, 주의사항, 권장사항
 4. **핵심 요점**: 가장 중요한 3-5개의 핵심 메시지
 
-최소 800자 이상의 상세한 요약을 작성하세요."""),
+최소 800자 이상의 상세한 요약을 작성하세요."""
+
+
+class SummaryAgent(Runnable):
+    """YouTube 영상을 포괄적으로 요약하는 에이전트 - taeho 백엔드 통합 버전"""
+
+    def __init__(self):
+        self.llm = get_chat_model("summary_agent", settings.BEDROCK_TEMPERATURE, settings.BEDROCK_MAX_TOKENS)
+
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", SUMMARY_SYSTEM_PROMPT),
             ("human", "다음 YouTube 영상 자막을 분석하여 포괄적인 요약을 작성해주세요:\n\n{caption}")
         ])
 
+        # 긴 자막용 map-reduce 프롬프트
+        self.map_prompt = ChatPromptTemplate.from_messages([
+            ("system", """당신은 긴 YouTube 영상 자막의 한 구간을 정리하는 전문가입니다.
+이 구간에 나오는 개념, 예시, 수치, 사실, 팁, 주의사항을 **빠짐없이** 상세하게 정리하세요.
+다른 구간과 합쳐질 예정이므로 서론/결론 없이 이 구간의 내용만 작성하세요."""),
+            ("human", "다음은 전체 {total}개 구간 중 {index}번째 구간의 자막입니다:\n\n{chunk}")
+        ])
+        self.reduce_prompt = ChatPromptTemplate.from_messages([
+            ("system", SUMMARY_SYSTEM_PROMPT),
+            ("human", "다음은 YouTube 영상 자막을 구간별로 정리한 내용입니다 (영상 순서대로). "
+                      "이를 하나의 포괄적인 요약으로 통합해주세요:\n\n{partial_summaries}")
+        ])
+        # 구간 요약이 너무 많을 때 인접 구간끼리 먼저 합치는 중간 단계 프롬프트
+        self.collapse_prompt = ChatPromptTemplate.from_messages([
+            ("system", """당신은 긴 YouTube 영상의 연속된 구간 정리들을 하나로 합치는 전문가입니다.
+개념, 예시, 수치, 사실, 팁, 주의사항을 **빠짐없이** 유지하면서 중복만 제거하세요.
+이후 다른 묶음과 다시 합쳐질 예정이므로 서론/결론 없이 이 구간들의 내용만 영상 순서대로 작성하세요."""),
+            ("human", "다음 구간 정리들을 하나로 합쳐주세요:\n\n{partial_summaries}")
+        ])
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=settings.SUMMARY_CHUNK_TOKENS,
+            chunk_overlap=settings.SUMMARY_CHUNK_OVERLAP_TOKENS,
+            length_function=_estimate_tokens,
+            separators=["\n\n", "\n", ". ", " ", ""]
+        )
+
     @track_llm_call("summary_agent")
     def invoke(self, state: dict, config=None):
         caption = state.get("caption", "")
@@ -57,19 +92,28 @@ class SummaryAgent(Runnable):
             except Exception as e:
                 logger.warning(f"진행률 업데이트 실패 (무시됨): {e}")
 
-        if not caption or "자막을 찾을 수 없습니다" in caption or "자막 추출 실패" in caption:
-            logger.warning("유효한 자막이 없습니다.")
-            return {**state, "summary": "자막을 분석할 수 없습니다. 영상에 자막이 없거나 추출에 실패했습니다."}
-
         try:
-            # 자막이 너무 길면 중요 부분 추출
-            processed_caption = self._preprocess_caption(caption)
-
-            response = self.llm.invoke(
-                self.prompt.format_messages(caption=processed_caption)
-            )
+            # 자막이 없어도 finally에서 스트림 종료(done)를 기록
+            if not caption or "자막을 찾을 수 없습니다" in caption or "자막 추출 실패" in caption:
+                logger.warning("유효한 자막이 없습니다.")
+                return {**state, "summary": "자막을 분석할 수 없습니다. 영상에 자막이 없거나 추출에 실패했습니다."}
+
+            partial_summaries = None
+            if settings.SUMMARY_MAP_REDUCE_ENABLED and len(caption) > settings.SUMMARY_MAP_REDUCE_THRESHOLD:
+                # 긴 자막은 구간별로 병렬 요약한 뒤 한 번에 통합 (내용 손실 없음)
+                partial_summaries = self._map_summaries(caption, job_id)
+                # 구간 요약 이후 취소됐으면 통합(reduce) 호출을 하지 않음
+                state_manager.raise_if_cancelled(job_id, llm_calls_saved=1)
+
+            if partial_summaries:
+                processed_caption = partial_summaries
+                messages = self.reduce_prompt.format_messages(partial_summaries=partial_summaries)
+            else:
+                # 자막이 너무 길면 중요 부분 추출
+                processed_caption = self._preprocess_caption(caption)
+                messages = self.prompt.format_messages(caption=processed_caption)
 
-            summary = response.content.strip()
+            summary = self._generate(messages, job_id)
 
             # 요약 품질 검증
             if len(summary) < 500:
@@ -78,16 +122,151 @@ class SummaryAgent(Runnable):
                     ("system", "이전 요약이 너무 간단합니다. 더 상세하고 포괄적인 요약을 작성해주세요."),
                     ("human", f"원본 자막:\n{processed_caption}\n\n이전 요약:\n{summary}\n\n더 상세한 요약을 작성해주세요.")
                 ])
-                response = self.llm.invoke(followup_prompt.format_messages())
-                summary = response.content.strip()
+                state_manager.raise_if_cancelled(job_id, llm_calls_saved=1)
+                if self._streaming(job_id):
+                    summary_stream.reset(job_id)
+                summary = self._generate(followup_prompt.format_messages(), job_id)
 
             logger.info(f"✅ 요약 생성 완료: {len(summary)}자")
             return {**state, "summary": summary}
 
+        except JobCancelledError:
+            raise
         except Exception as e:
             error_msg = f"요약 생성 중 오류가 발생했습니다: {str(e)}"
             logger.error(error_msg)
             return {**state, "summary": error_msg}
+        finally:
+            if self._streaming(job_id):
+                summary_stream.finish(job_id)
+
+    def _streaming(self, job_id: str) -> bool:
+        return settings.SUMMARY_STREAMING_ENABLED and bool(job_id)
+
+    def _generate(self, messages, job_id: str) -> str:
+        """
+        요약 생성 LLM 호출
+
+        스트리밍 모드에서는 Bedrock 스트리밍 API로 받은 텍스트를 작업별 채널(summary_stream)에
+        0.2초 단위로 묶어 전달하고, 전체 텍스트를 반환합니다.
+        llm.stream은 LLM 캐시를 거치지 않으므로 캐시 조회/저장을 직접 처리합니다.
+        """
+        if not self._streaming(job_id):
+            return self.llm.invoke(messages).content.strip()
+
+        cached = lookup_chat_text(self.llm, messages)
+        if cached is not None:
+            summary_stream.publish(job_id, cached)
+            return cached.strip()
+
+        parts = []
+        buffer = []
+        last_flush = time.monotonic()
+
+        for chunk in self.llm.stream(messages):
+            text = chunk.content
+            if isinstance(text, list):
+                text = "".join(block.get("text", "") for block in text if isinstance(block, dict))
+            if not text:
+                continue
+
+            parts.append(text)
+            buffer.append(text)
+            if time.monotonic() - last_flush >= 0.2:
+                summary_stream.publish(job_id, "".join(buffer))
+                buffer = []
+                last_flush = time.monotonic()
+
+        if buffer:
+            summary_stream.publish(job_id, "".join(buffer))
+
+        text = "".join(parts)
+        update_chat_text(self.llm, messages, text)
+        return text.strip()
+
+    def _map_summaries(self, caption: str, job_id: str = None) -> str:
+        """
+        자막을 토큰 예산 단위로 나누어 구간별 요약을 병렬 생성 (map 단계)
+
+        Returns:
+            영상 순서대로 이어 붙인 구간 요약 (모든 구간이 실패하면 빈 문자열)
+            합친 길이가 SUMMARY_REDUCE_MAX_TOKENS를 넘으면 _collapse_summaries로 줄인 결과
+        """
+        chunks = self.splitter.split_text(caption)
+        total = len(chunks)
+        logger.info(f"🧩 map-reduce 요약: {len(caption)}자 -> {total}개 구간 "
+                    f"(동시 실행: {settings.SUMMARY_MAP_CONCURRENCY})")
+
+        responses = self.llm.batch(
+            [self.map_prompt.format_messages(total=total, index=i + 1, chunk=chunk) for i, chunk in enumerate(chunks)],
+            config={"max_concurrency": max(1, settings.SUMMARY_MAP_CONCURRENCY)},
+            return_exceptions=True
+        )
+
+        partials = []
+        for i, response in enumerate(responses):
+            if isinstance(response, Exception):
+                logger.warning(f"구간 {i + 1}/{total} 요약 실패 (제외됨): {response}")
+                continue
+            partials.append(f"[구간 {i + 1}/{total}]\n{response.content.strip()}")
+
+        if not partials:
+            logger.warning("모든 구간 요약이 실패했습니다. 자막 전처리 방식으로 전환합니다.")
+            return ""
+
+        return "\n\n".join(self._collapse_summaries(partials, job_id))
+
+    def _collapse_summaries(self, partials: List[str], job_id: str = None) -> List[str]:
+        """
+        구간 요약을 합친 길이가 통합(reduce) 예산 이하가 될 때까지 인접 구간끼리 묶어 합침
+
+        각 단계에서 예산에 맞게 인접 구간을 묶고(최소 2개씩) 묶음별로 병렬 요약하므로
+        단계마다 항목 수가 줄어듭니다. 실패한 묶음은 원문을 그대로 이어 붙여 내용을 잃지 않습니다.
+        """
+        budget = max(1, settings.SUMMARY_REDUCE_MAX_TOKENS)
+        level = 0
+
+        while len(partials) > 1 and _estimate_tokens("\n\n".join(partials)) > budget:
+            state_manager.raise_if_cancelled(job_id, llm_calls_saved=1)
+            level += 1
+
+            groups: List[List[str]] = []
+            size = 0
+            for partial in partials:
+                tokens = _estimate_tokens(partial)
+                if groups and size + tokens <= budget:
+                    groups[-1].append(partial)
+                    size += tokens
+                else:
+                    groups.append([partial])
+                    size = tokens
+            if len(groups) == len(partials):
+                # 구간 하나하나가 예산의 절반을 넘으면 2개씩 묶어 항목 수를 줄임
+                groups = [partials[i:i + 2] for i in range(0, len(partials), 2)]
+
+            merge_groups = [group for group in groups if len(group) > 1]
+            logger.info(f"🧩 구간 요약 {level}단계 통합: {len(partials)}개 -> {len(groups)}개 묶음")
+
+            responses = iter(self.llm.batch(
+                [self.collapse_prompt.format_messages(partial_summaries="\n\n".join(group)) for group in merge_groups],
+                config={"max_concurrency": max(1, settings.SUMMARY_MAP_CONCURRENCY)},
+                return_exceptions=True
+            ))
+
+            collapsed = []
+            for k, group in enumerate(groups):
+                if len(group) == 1:
+                    collapsed.append(group[0])
+                    continue
+                response = next(responses)
+                if isinstance(response, Exception):
+                    logger.warning(f"묶음 {k + 1}/{len(groups)} 통합 실패 (원문 유지): {response}")
+                    collapsed.append("\n\n".join(group))
+                    continue
+                collapsed.append(f"[묶음 {k + 1}/{len(groups)}]\n{response.content.strip()}")
+            partials = collapsed
+
+        return partials
 
     def _preprocess_caption(self, caption: str) -> str:
         """자막 전처리 - 중요 부분 추출"""
@@ -1,12 +1,12 @@
 # app/agents/report_agent.py
 import os
 import json
-import boto3
 from typing import Dict, List, Any
-from langchain_aws import ChatBedrock
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from app.core.config import settings
+from app.core.bedrock_registry import get_chat_model
+from app.core.llm_cache import evict_chat
 from app.analyze.services.state_manager import state_manager
 import logging
 
@@ -17,16 +17,27 @@ class ReportAgent(Runnable):
     """요약과 시각화를 결합하여 최종 리포트를 생성하는 에이전트 - taeho 백엔드 통합 버전"""
 
     def __init__(self):
-        self.llm = ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-            model=settings.BEDROCK_MODEL_ID,
-            model_kwargs={"temperature": settings.BEDROCK_TEMPERATURE, "max_tokens": settings.BEDROCK_MAX_TOKENS}
-        )
+        self.llm = get_chat_model("report_agent", settings.BEDROCK_TEMPERATURE, settings.BEDROCK_MAX_TOKENS)
+
+    def structure(self, state: dict, config=None) -> dict:
+        """
+        요약을 섹션으로 구조화하는 노드 (시각화 분석/생성과 병렬 실행)
+
+        Returns:
+            structured_sections만 담은 부분 state
+        """
+        summary = state.get("summary", "")
+        if not summary:
+            return {"structured_sections": []}
+
+        logger.info("📝 요약을 섹션으로 구조화 중...")
+        return {"structured_sections": self._structure_summary(summary)}
 
     def invoke(self, state: dict, config=None) -> dict:
         """요약과 시각화를 결합하여 최종 리포트 생성"""
         summary = state.get("summary", "")
         visual_sections = state.get("visual_sections", [])
+        structured_sections = state.get("structured_sections")
         job_id = state.get("job_id")
         user_id = state.get("user_id")
 
@@ -44,9 +55,10 @@ class ReportAgent(Runnable):
             return {**state, "report_result": self._create_error_report("요약을 생성할 수 없습니다.")}
 
         try:
-            # 1. 요약을 섹션으로 구조화
-            logger.info("📝 요약을 섹션으로 구조화 중...")
-            structured_sections = self._structure_summary(summary)
+            # 1. 요약을 섹션으로 구조화 (structure 노드에서 미리 구조화된 경우 재사용)
+            if structured_sections is None:
+                logger.info("📝 요약을 섹션으로 구조화 중...")
+                structured_sections = self._structure_summary(summary)
 
             # 2. 시각화를 적절한 위치에 삽입
             logger.info(f"🎨 {len(visual_sections)}개의 시각화를 배치 중...")
@@ -103,8 +115,9 @@ JSON만 출력하세요."""),
             ("human", "{summary}")
         ])
 
+        messages = prompt.format_messages(summary=summary)
         try:
-            response = self.llm.invoke(prompt.format_messages(summary=summary))
+            response = self.llm.invoke(messages)
             content = response.content.strip()
 
             # JSON 추출
@@ -117,8 +130,13 @@ JSON만 출력하세요."""),
                 return result.get('sections', [])
             else:
                 # 폴백: 단락 기반 섹션 생성
+                evict_chat(self.llm, messages)
                 return self._fallback_sectioning(summary)
 
+        except json.JSONDecodeError as e:
+            logger.error(f"섹션 구조화 JSON 파싱 오류: {e}")
+            evict_chat(self.llm, messages)
+            return self._fallback_sectioning(summary)
         except Exception as e:
             logger.error(f"섹션 구조화 오류: {e}")
             return self._fallback_sectioning(summary)
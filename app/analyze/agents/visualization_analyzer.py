@@ -1,10 +1,10 @@
 import json
-import boto3
 from typing import Dict, List, Any, Optional
-from langchain_aws import ChatBedrock
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from app.core.config import settings
+from app.core.bedrock_registry import get_chat_model
+from app.core.llm_cache import evict_chat
 from app.analyze.services.state_manager import state_manager
 import logging
 
@@ -61,14 +61,8 @@ class VisualizationAnalyzer(Runnable):
 
     def __init__(self):
         """LLM 초기화"""
-        self.llm = ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-            model=settings.BEDROCK_MODEL_ID,
-            model_kwargs={
-                "temperature": 0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-                "max_tokens": settings.BEDROCK_MAX_TOKENS
-            }
-        )
+        # 일관성 있는 분석을 위해 낮은 temperature
+        self.llm = get_chat_model("visualization_analyzer", 0.3, settings.BEDROCK_MAX_TOKENS)
 
     def invoke(self, state: dict, config=None) -> dict:
         """
@@ -79,7 +73,8 @@ class VisualizationAnalyzer(Runnable):
             config: 실행 설정 (선택)
 
         Returns:
-            업데이트된 state - visualization_requests 추가
+            visualization_requests만 담은 부분 state (ReportAgent.structure와 병렬 실행되므로
+            다른 키를 함께 반환하면 LangGraph 상태 갱신이 충돌함)
         """
         summary = state.get("summary", "")  # ← workflow에 맞게 수정
         job_id = state.get("job_id")
@@ -96,7 +91,7 @@ class VisualizationAnalyzer(Runnable):
         # 입력 검증
         if not summary or len(summary.strip()) < 50:
             logger.warning("요약 내용이 너무 짧거나 없습니다.")
-            return {**state, "visualization_requests": []}
+            return {"visualization_requests": []}
 
         try:
             # correct-visualization-agents 브랜치 로직과 동일하게 처리
@@ -120,15 +115,17 @@ class VisualizationAnalyzer(Runnable):
                 for i, req in enumerate(viz_requests):
                     content_len = len(req.get('related_content', ''))
                     logger.info(f"   요청 {i + 1}: {req.get('purpose', 'unknown')} - {content_len}자")
-                return {**state, "visualization_requests": viz_requests}
+                return {"visualization_requests": viz_requests}
 
             else:
                 logger.error("JSON 파싱 실패")
-                return {**state, "visualization_requests": []}
+                evict_chat(self.llm, prompt)
+                return {"visualization_requests": []}
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 오류: {e}")
-            return {**state, "visualization_requests": []}
+            evict_chat(self.llm, prompt)
+            return {"visualization_requests": []}
         except Exception as e:
             logger.error(f"시각화 요청 분석 실패: {e}")
-            return {**state, "visualization_requests": []} 
\ No newline at end of file
+            return {"visualization_requests": []} 
\ No newline at end of file
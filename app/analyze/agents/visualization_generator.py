@@ -1,10 +1,13 @@
 import json
-import boto3
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, List, Any, Optional
-from langchain_aws import ChatBedrock
 from langchain_core.runnables import Runnable
 from app.core.config import settings
-from app.analyze.services.state_manager import state_manager
+from app.core.bedrock_registry import get_chat_model
+from app.core.llm_cache import evict_chat
+from app.analyze.services.state_manager import state_manager, JobCancelledError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -198,14 +201,8 @@ class SmartVisualAgent(Runnable):
 
     def __init__(self):
         """LLM 초기화"""
-        self.llm = ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-            model_id=settings.BEDROCK_MODEL_ID,
-            model_kwargs={
-                "temperature": 0.3,  # 일관성 있는 시각화를 위해 낮은 temperature
-                "max_tokens": settings.BEDROCK_MAX_TOKENS
-            }
-        )
+        # 일관성 있는 시각화를 위해 낮은 temperature
+        self.llm = get_chat_model("visualization_generator", 0.3, settings.BEDROCK_MAX_TOKENS)
 
     def invoke(self, state: dict, config=None) -> dict:
         """
@@ -236,65 +233,134 @@ class SmartVisualAgent(Runnable):
             logger.info("❌ 시각화 요청이 없습니다.")
             return {**state, "visual_sections": []}
 
-        logger.info(f"🎯 {len(visualization_requests)}개 시각화 생성 시작...")
-
-        visual_sections = []
+        max_workers = max(1, min(settings.VISUALIZATION_MAX_CONCURRENCY, len(visualization_requests)))
+        logger.info(f"🎯 {len(visualization_requests)}개 시각화 생성 시작... (동시 실행: {max_workers})")
 
-        for i, req in enumerate(visualization_requests):
-            viz_id = f"viz_{i + 1:03d}"  # viz_001, viz_002, ...
-            logger.info(f"🎯 시각화 {i + 1}/{len(visualization_requests)} 생성 중... (ID: {viz_id})")
+        # 동시 실행 수가 1이어도 같은 경로로 실행해야 항목별 시간 제한/취소가 적용됨
+        results = self._generate_parallel(visualization_requests, caption_context, max_workers, job_id)
 
-            try:
-                # 프롬프트 생성
-                prompt = VISUALIZATION_GENERATION_PROMPT.format(
-                    purpose=req.get('purpose', ''),
-                    content_description=req.get('content_description', ''),
-                    related_content=req.get('related_content', ''),
-                    caption_context=caption_context[:1000]  # 길이 제한
-                )
-
-                response = self.llm.invoke(prompt)
-                content = response.content.strip()
-
-                # JSON 추출
-                start_idx = content.find('{')
-                end_idx = content.rfind('}')
-
-                if start_idx != -1 and end_idx != -1:
-                    json_part = content[start_idx:end_idx + 1]
-                    viz_result = json.loads(json_part)
-
-                    # ReportAgent에 맞는 형식으로 변환
-                    visual_section = {
-                        "title": viz_result.get('title', f'시각화 {i + 1}'),
-                        "visualization_type": self._convert_viz_type(viz_result.get('type')),
-                        "data": viz_result,  # 전체 시각화 데이터
-                        "insight": viz_result.get('insight', ''),
-                        "position": {"after_paragraph": i},  # 순서대로 배치
-                        "purpose": req.get('purpose', ''),
-                        "user_benefit": f"{req.get('content_description', '')}에 대한 시각적 이해를 돕습니다."
-                    }
-
-                    visual_sections.append(visual_section)
-
-                    # 시각화 타입별 로깅
-                    viz_type = viz_result.get('type', 'unknown')
-                    viz_title = viz_result.get('title', '제목 없음')
-                    logger.info(f"✅ 시각화 {viz_id} 생성 성공: {viz_type} - {viz_title}")
-
-                else:
-                    logger.warning(f"⚠️ 시각화 {viz_id} JSON 파싱 실패")
-
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ 시각화 {viz_id} JSON 파싱 오류: {e}")
-            except Exception as e:
-                logger.error(f"❌ 시각화 {viz_id} 생성 실패: {e}")
+        # 요청 순서(position.after_paragraph)대로 정렬
+        visual_sections = [results[i] for i in sorted(results)]
 
         logger.info(f"🎨 시각화 생성 완료: {len(visual_sections)}/{len(visualization_requests)}개 성공")
 
         # yesol 브랜치 ReportAgent와 호환되도록 visual_sections에 저장
         return {**state, "visual_sections": visual_sections}
 
+    def _generate_parallel(self, visualization_requests: List[Dict], caption_context: str,
+                           max_workers: int, job_id: str = None) -> Dict[int, Dict[str, Any]]:
+        """
+        시각화 요청을 제한된 동시성으로 병렬 생성 (max_workers가 1이면 순서대로 1건씩 실행)
+
+        각 항목은 실행이 시작된 시점부터 VISUALIZATION_ITEM_TIMEOUT 초가 지나면
+        결과를 기다리지 않고 제외합니다. 나머지 항목은 그대로 진행됩니다.
+        작업이 취소되면 시작하지 않은 항목을 취소하고 JobCancelledError를 발생시킵니다.
+
+        Returns:
+            요청 인덱스 -> visual_section 매핑 (성공한 항목만)
+        """
+        total = len(visualization_requests)
+        item_timeout = settings.VISUALIZATION_ITEM_TIMEOUT
+        results: Dict[int, Dict[str, Any]] = {}
+        started_at: Dict[int, float] = {}
+
+        def run(i: int, req: Dict) -> Optional[Dict[str, Any]]:
+            started_at[i] = time.monotonic()
+            return self._generate_visualization(i, req, caption_context, total)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="viz")
+        try:
+            # 호출 스레드의 컨텍스트(LLM 캐시 우회 여부 등)를 항목별로 복사해 실행
+            futures = {
+                executor.submit(contextvars.copy_context().run, run, i, req): i
+                for i, req in enumerate(visualization_requests)
+            }
+            pending = set(futures)
+
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+                if state_manager.is_cancelled(job_id):
+                    not_started = sum(1 for future in pending if futures[future] not in started_at)
+                    raise JobCancelledError(job_id, llm_calls_saved=not_started)
+
+                for future in done:
+                    i = futures[future]
+                    try:
+                        visual_section = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ 시각화 viz_{i + 1:03d} 생성 실패: {e}")
+                        continue
+                    if visual_section:
+                        results[i] = visual_section
+
+                # 실행 시간이 제한을 넘은 항목은 버리고 나머지만 기다림
+                now = time.monotonic()
+                for future in list(pending):
+                    i = futures[future]
+                    if i in started_at and now - started_at[i] > item_timeout:
+                        logger.warning(f"⏱️ 시각화 viz_{i + 1:03d} 시간 초과 ({item_timeout:.0f}초) - 제외합니다")
+                        pending.discard(future)
+        finally:
+            # 시간 초과/취소로 남은 스레드는 기다리지 않고, 시작 전 항목은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _generate_visualization(self, i: int, req: Dict, caption_context: str,
+                                total: int) -> Optional[Dict[str, Any]]:
+        """시각화 요청 1건에 대한 LLM 호출 및 결과 변환 (실패 시 None)"""
+        viz_id = f"viz_{i + 1:03d}"  # viz_001, viz_002, ...
+        logger.info(f"🎯 시각화 {i + 1}/{total} 생성 중... (ID: {viz_id})")
+
+        try:
+            # 프롬프트 생성
+            prompt = VISUALIZATION_GENERATION_PROMPT.format(
+                purpose=req.get('purpose', ''),
+                content_description=req.get('content_description', ''),
+                related_content=req.get('related_content', ''),
+                caption_context=caption_context[:1000]  # 길이 제한
+            )
+
+            response = self.llm.invoke(prompt)
+            content = response.content.strip()
+
+            # JSON 추출
+            start_idx = content.find('{')
+            end_idx = content.rfind('}')
+
+            if start_idx == -1 or end_idx == -1:
+                logger.warning(f"⚠️ 시각화 {viz_id} JSON 파싱 실패")
+                evict_chat(self.llm, prompt)
+                return None
+
+            json_part = content[start_idx:end_idx + 1]
+            viz_result = json.loads(json_part)
+
+            # ReportAgent에 맞는 형식으로 변환
+            visual_section = {
+                "title": viz_result.get('title', f'시각화 {i + 1}'),
+                "visualization_type": self._convert_viz_type(viz_result.get('type')),
+                "data": viz_result,  # 전체 시각화 데이터
+                "insight": viz_result.get('insight', ''),
+                "position": {"after_paragraph": i},  # 순서대로 배치
+                "purpose": req.get('purpose', ''),
+                "user_benefit": f"{req.get('content_description', '')}에 대한 시각적 이해를 돕습니다."
+            }
+
+            # 시각화 타입별 로깅
+            viz_type = viz_result.get('type', 'unknown')
+            viz_title = viz_result.get('title', '제목 없음')
+            logger.info(f"✅ 시각화 {viz_id} 생성 성공: {viz_type} - {viz_title}")
+            return visual_section
+
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ 시각화 {viz_id} JSON 파싱 오류: {e}")
+            evict_chat(self.llm, prompt)
+        except Exception as e:
+            logger.error(f"❌ 시각화 {viz_id} 생성 실패: {e}")
+        return None
+
     def _convert_viz_type(self, viz_type: str) -> str:
         """새로운 시각화 타입을 ReportAgent가 이해할 수 있는 형식으로 변환"""
         type_mapping = {
@@ -7,6 +7,7 @@ from datetime import datetime
 class YouTubeReporterRequest(BaseModel):
     """YouTube Reporter 분석 요청 모델"""
     youtube_url: str = Field(..., description="분석할 YouTube 영상 URL")
+    force_refresh: bool = Field(False, description="최근 완료된 같은 영상의 리포트를 재사용하지 않고 새로 분석")
 
 
 class YouTubeReporterResponse(BaseModel):
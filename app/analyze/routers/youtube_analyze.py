@@ -1,12 +1,21 @@
 # app/analyze/routers/youtube_analyze.py
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import Dict, Any
+import json
+import time
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, Optional
 
 from app.analyze.core.auth import get_current_user
-from app.database.core.database import get_db
+from app.database.core.database import get_async_db, AsyncSessionLocal
 from app.analyze.services.youtube_analyze_service import youtube_reporter_service
-from app.database.services.database_service import database_service
+from app.analyze.services.summary_stream import summary_stream
+from app.analyze.services.state_manager import state_manager
+from app.analyze.services.job_executor import job_executor, JobQueueFullError
+from app.core.config import settings
+from app.database.services.async_database_service import async_database_service
+from app.database.core.pagination import InvalidCursorError
 from app.analyze.models.youtube_analyze import YouTubeReporterRequest, YouTubeReporterResponse
 import logging
 
@@ -14,36 +23,46 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/analyze", tags=["YouTube Reporter"])
 
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _get_job_status(job_id: str, user_id: str):
+    """독립 세션으로 작업 상태 조회 (SSE 스트림은 요청 세션보다 오래 유지되므로)"""
+    async with AsyncSessionLocal() as db:
+        job = await async_database_service.get_job_by_id(db, job_id, user_id)
+        if not job:
+            return None
+        return {
+            "job_id": job_id,
+            "status": job.status,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None
+        }
 
-async def run_youtube_analysis(job_id: str, user_id: str, youtube_url: str):
-    """백그라운드에서 YouTube 분석 실행 (독립적인 DB 세션 사용)"""
-    from app.database.core.database import SessionLocal
-    
-    db = SessionLocal()
-    try:
-        await youtube_reporter_service.process_youtube_analysis(
-            job_id=job_id,
-            user_id=user_id,
-            youtube_url=youtube_url,
-            db=db
-        )
-    except Exception as e:
-        logger.error(f"백그라운드 YouTube 분석 실패: {job_id} - {str(e)}")
-    finally:
-        db.close()
+
+def _queue_full_exception(e: JobQueueFullError) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)}
+    )
 
 
 @router.post("/youtube", response_model=YouTubeReporterResponse)
 async def create_youtube_analysis(
         request: YouTubeReporterRequest,
-        background_tasks: BackgroundTasks,
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     YouTube 영상 분석 및 스마트 시각화 리포트 생성
 
     - **youtube_url**: 분석할 YouTube 영상 URL
+    - **force_refresh**: 최근 완료된 같은 영상의 리포트를 재사용하지 않고 새로 분석
     """
     try:
         user_id = current_user["user_id"]
@@ -51,20 +70,35 @@ async def create_youtube_analysis(
 
         logger.info(f"🎬 YouTube Reporter 분석 요청: {youtube_url} (User: {user_id})")
 
+        local_queue = settings.JOB_QUEUE_BACKEND.lower() != "database"
+
+        # 대기열이 가득 찼으면 작업을 만들지 않고 바로 거절
+        if local_queue and not job_executor.has_capacity():
+            raise _queue_full_exception(JobQueueFullError(settings.ANALYSIS_QUEUE_RETRY_AFTER_SECONDS))
+
         # 1. 작업 생성
         job_id = await youtube_reporter_service.create_analysis_job(
             user_id=user_id,
             youtube_url=youtube_url,
-            db=db
+            db=db,
+            force_refresh=request.force_refresh,
+            worker_id=job_executor.worker_id if local_queue else None
         )
 
-        # 2. 백그라운드에서 분석 실행 (독립적인 세션)
-        background_tasks.add_task(
-            run_youtube_analysis,
-            job_id=job_id,
-            user_id=user_id,
-            youtube_url=youtube_url
-        )
+        # 2. 분석 실행 (database 대기열이면 워커 프로세스가 가져가 실행)
+        if local_queue:
+            try:
+                job_executor.submit(
+                    job_id,
+                    youtube_reporter_service.run_job,
+                    job_id=job_id,
+                    user_id=user_id,
+                    youtube_url=youtube_url,
+                    force_refresh=request.force_refresh
+                )
+            except JobQueueFullError as e:
+                await async_database_service.update_job_status(db=db, job_id=job_id, status="failed")
+                raise _queue_full_exception(e)
 
         return YouTubeReporterResponse(
             job_id=job_id,
@@ -73,6 +107,8 @@ async def create_youtube_analysis(
             estimated_time="2-5분"
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"YouTube Reporter 분석 요청 실패: {str(e)}")
         raise HTTPException(
@@ -85,7 +121,7 @@ async def create_youtube_analysis(
 async def get_analysis_status(
         job_id: str,
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     YouTube Reporter 분석 작업 상태 조회
@@ -96,7 +132,7 @@ async def get_analysis_status(
         user_id = current_user["user_id"]
 
         # 데이터베이스에서 작업 정보 조회
-        job = database_service.get_job_by_id(db, job_id, user_id)
+        job = await async_database_service.get_job_by_id(db, job_id, user_id)
         if not job:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
 
@@ -127,11 +163,128 @@ async def get_analysis_status(
         )
 
 
+@router.get("/jobs/{job_id}/events")
+async def stream_analysis_events(
+        job_id: str,
+        current_user: dict = Depends(get_current_user)
+):
+    """
+    작업 진행률을 Server-Sent Events로 실시간 전달 (상태 조회 폴링 대체)
+
+    - **job_id**: 작업 ID
+
+    이벤트: progress(진행률 변경), complete(작업 종료, 최종 status 포함)
+    """
+    user_id = current_user["user_id"]
+
+    # 요청 세션은 스트림이 끝날 때까지 정리되지 않으므로 짧은 독립 세션으로 확인
+    if not await _get_job_status(job_id, user_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    async def event_stream():
+        listener = state_manager.listen(job_id)
+        next_message = None
+        deadline = time.monotonic() + settings.PROGRESS_STREAM_MAX_SECONDS
+
+        try:
+            # 구독 확인({"subscribed": True})을 받은 뒤 현재 상태를 확인해야 그 사이의 변경을 놓치지 않음
+            await listener.__anext__()
+            next_message = asyncio.ensure_future(listener.__anext__())
+
+            final_status = await _get_job_status(job_id, user_id)
+            if final_status and final_status["status"] != "processing":
+                yield _sse_event("complete", final_status)
+                return
+            yield _sse_event("progress", {"job_id": job_id, **state_manager.get_progress(job_id)})
+
+            while time.monotonic() < deadline:
+                done, _ = await asyncio.wait({next_message}, timeout=15)
+                if not done:
+                    # 대기열에 있거나 마지막 진행률 메시지를 놓친 작업도 종료를 감지하도록 DB 상태 재확인
+                    final_status = await _get_job_status(job_id, user_id)
+                    if final_status and final_status["status"] != "processing":
+                        yield _sse_event("complete", final_status)
+                        return
+                    # 프록시 연결 유지용 주석 라인
+                    yield ": keep-alive\n\n"
+                    continue
+
+                message = next_message.result()
+                next_message = asyncio.ensure_future(listener.__anext__())
+
+                if not message.get("removed"):
+                    yield _sse_event("progress", {"job_id": job_id, **message})
+
+                # 완료/실패/취소 가능성이 있을 때만 DB에서 최종 상태 확인
+                progress = message.get("progress", 0)
+                if message.get("removed") or message.get("cancelled") or progress >= 100 or progress < 0:
+                    final_status = await _get_job_status(job_id, user_id)
+                    if final_status and final_status["status"] != "processing":
+                        yield _sse_event("complete", final_status)
+                        return
+        finally:
+            # 대기 중인 수신을 취소해야 구독(finally)이 정리됨
+            if next_message is not None:
+                next_message.cancel()
+                await asyncio.gather(next_message, return_exceptions=True)
+            await listener.aclose()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.get("/jobs/{job_id}/summary/stream")
+async def stream_analysis_summary(
+        job_id: str,
+        current_user: dict = Depends(get_current_user)
+):
+    """
+    생성 중인 요약을 Server-Sent Events로 실시간 전달
+
+    - **job_id**: 작업 ID
+
+    이벤트: delta(텍스트 조각), reset(재생성으로 이전 텍스트 폐기), done(요약 종료)
+    """
+    user_id = current_user["user_id"]
+
+    # 요청 세션은 스트림이 끝날 때까지 정리되지 않으므로 짧은 독립 세션으로 확인
+    job_status = await _get_job_status(job_id, user_id)
+    if not job_status:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    already_finished = job_status["status"] != "processing"
+
+    async def event_stream():
+        offset = 0
+        last_event_at = last_ping_at = time.monotonic()
+
+        while True:
+            events = await asyncio.to_thread(summary_stream.read, job_id, offset)
+            for event in events:
+                offset += 1
+                yield _sse_event(event["type"], event)
+                if event["type"] == "done":
+                    return
+
+            now = time.monotonic()
+            if events:
+                last_event_at = now
+            elif already_finished or now - last_event_at > settings.SUMMARY_STREAM_IDLE_TIMEOUT:
+                yield _sse_event("done", {"type": "done"})
+                return
+            elif now - last_ping_at > 15:
+                # 프록시 연결 유지용 주석 라인
+                yield ": keep-alive\n\n"
+                last_ping_at = now
+
+            await asyncio.sleep(0.25)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.get("/jobs/{job_id}/result")
 async def get_analysis_result(
         job_id: str,
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     YouTube Reporter 분석 결과 조회
@@ -142,7 +295,7 @@ async def get_analysis_result(
         user_id = current_user["user_id"]
 
         # 작업 상태 확인
-        job = database_service.get_job_by_id(db, job_id, user_id)
+        job = await async_database_service.get_job_by_id(db, job_id, user_id)
         if not job:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
 
@@ -163,25 +316,22 @@ async def get_analysis_result(
             )
 
         # 보고서 조회
-        reports = database_service.get_user_reports(db, user_id)
-        job_report = next((r for r in reports if str(r.job_id) == job_id), None)
+        job_report = await async_database_service.get_report_by_job_id(db, job_id, user_id)
 
         if not job_report:
             raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
 
         # S3에서 리포트 내용 가져오기
         from app.s3.services.user_s3_service import user_s3_service
-        import json
 
         try:
             download_url = user_s3_service.get_presigned_url(job_report.s3_key)
             
-            # S3에서 리포트 내용 조회
+            # S3에서 리포트 내용 조회 (변경되지 않았으면 캐시 사용)
             report_content = None
             try:
-                content = user_s3_service.get_file_content(job_report.s3_key)
-                if content and job_report.file_type == 'json':
-                    report_content = json.loads(content)
+                if job_report.file_type == 'json':
+                    report_content = user_s3_service.get_report_json(job_report.s3_key)
                     logger.info(f"S3에서 리포트 내용 조회: {job_id}")
             except Exception as e:
                 logger.warning(f"리포트 내용 조회 실패: {e}")
@@ -218,37 +368,46 @@ async def get_analysis_result(
 
 @router.get("/jobs")
 async def list_my_analyses(
+        limit: int = Query(50, ge=1, le=100, description="페이지 크기"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
-    내 YouTube Reporter 분석 작업 목록 조회 (로그인 선택적)
+    내 YouTube Reporter 분석 작업 목록 조회 (로그인 선택적, 최신순 커서 페이지)
+
+    - **limit**: 페이지 크기
+    - **cursor**: 다음 페이지 조회 시 이전 응답의 next_cursor
     """
     try:
         # 로그인하지 않은 경우 빈 목록 반환
         if not current_user:
-            return {"jobs": [], "total": 0}
+            return {"jobs": [], "total": 0, "next_cursor": None}
             
         user_id = current_user["user_id"]
 
-        # YouTube Reporter 작업만 필터링
-        all_jobs = database_service.get_user_jobs(db, user_id)
-        youtube_jobs = [job for job in all_jobs if job.job_type == "youtube_reporter"]
+        # YouTube Reporter 작업만 조회 (DB에서 필터링, 목록 컬럼만 조회)
+        youtube_jobs, next_cursor = await async_database_service.get_user_job_summaries_page(
+            db, user_id, job_type="youtube_reporter", limit=limit, cursor=cursor
+        )
 
         return {
             "jobs": [
                 {
                     "id": str(job.id),
                     "status": job.status,
-                    "youtube_url": job.input_data.get("youtube_url", ""),
+                    "youtube_url": job.youtube_url or "",
                     "created_at": job.created_at.isoformat(),
                     "completed_at": job.completed_at.isoformat() if job.completed_at else None
                 }
                 for job in youtube_jobs
             ],
-            "total": len(youtube_jobs)
+            "total": len(youtube_jobs),
+            "next_cursor": next_cursor
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"작업 목록 조회 실패: {str(e)}")
         raise HTTPException(
@@ -261,7 +420,7 @@ async def list_my_analyses(
 async def cancel_analysis_job(
         job_id: str,
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     YouTube Reporter 분석 작업 취소
@@ -272,19 +431,18 @@ async def cancel_analysis_job(
         user_id = current_user["user_id"]
 
         # 작업 존재 확인
-        job = database_service.get_job_by_id(db, job_id, user_id)
+        job = await async_database_service.get_job_by_id(db, job_id, user_id)
         if not job:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
         
         if job.status != "processing":
             raise HTTPException(status_code=400, detail="진행 중인 작업만 취소할 수 있습니다")
 
-        # 취소 요청
-        from app.analyze.services.state_manager import state_manager
+        # DB 상태를 먼저 커밋해야 취소 메시지를 받은 SSE 스트림이 cancelled 상태를 확인할 수 있음
+        await async_database_service.update_job_status(db, job_id, "cancelled")
+
+        # 취소 요청 (실행 중인 노드/에이전트가 확인 후 중단, database 대기열 워커는 하트비트에서 감지)
         state_manager.cancel_job(job_id)
-        
-        # DB 상태 업데이트
-        database_service.update_job_status(db, job_id, "cancelled")
 
         return {"message": f"작업 {job_id} 취소 요청이 전송되었습니다"}
 
@@ -298,11 +456,79 @@ async def cancel_analysis_job(
         )
 
 
+@router.post("/jobs/{job_id}/resume", response_model=YouTubeReporterResponse)
+async def resume_analysis_job(
+        job_id: str,
+        current_user: dict = Depends(get_current_user),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """
+    실패/중단된 YouTube Reporter 분석 작업을 마지막으로 완료된 단계부터 재개
+
+    - **job_id**: 재개할 작업 ID
+    """
+    try:
+        user_id = current_user["user_id"]
+
+        job = await async_database_service.get_job_by_id(db, job_id, user_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+        if job.status != "failed":
+            raise HTTPException(status_code=400, detail="실패한 작업만 재개할 수 있습니다")
+
+        if not youtube_reporter_service.can_resume(job_id):
+            raise HTTPException(status_code=409, detail="재개할 수 있는 체크포인트가 없습니다. 새로 분석을 요청해주세요")
+
+        local_queue = settings.JOB_QUEUE_BACKEND.lower() != "database"
+        if local_queue and not job_executor.has_capacity():
+            raise _queue_full_exception(JobQueueFullError(settings.ANALYSIS_QUEUE_RETRY_AFTER_SECONDS))
+
+        await async_database_service.requeue_job(db, job_id, worker_id=job_executor.worker_id if local_queue else None)
+        # 이전 실행에서 남은 취소 플래그로 재개가 바로 중단되지 않도록 제거
+        state_manager.clear_cancelled(job_id)
+
+        if local_queue:
+            input_data = job.input_data or {}
+            try:
+                job_executor.submit(
+                    job_id,
+                    youtube_reporter_service.run_job,
+                    job_id=job_id,
+                    user_id=user_id,
+                    youtube_url=input_data.get("youtube_url"),
+                    include_audio=input_data.get("include_audio", True),
+                    force_refresh=input_data.get("force_refresh", False),
+                    resume=True
+                )
+            except JobQueueFullError as e:
+                await async_database_service.update_job_status(db=db, job_id=job_id, status="failed")
+                raise _queue_full_exception(e)
+
+        logger.info(f"🔁 작업 재개 요청: {job_id} (User: {user_id})")
+
+        return YouTubeReporterResponse(
+            job_id=job_id,
+            status="processing",
+            message="🔁 분석을 마지막으로 완료된 단계부터 재개합니다...",
+            estimated_time="1-3분"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"작업 재개 실패: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"작업 재개 실패: {str(e)}"
+        )
+
+
 @router.delete("/jobs/{job_id}")
 async def delete_analysis_job(
         job_id: str,
         current_user: dict = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
     """
     YouTube Reporter 분석 작업 삭제
@@ -313,7 +539,7 @@ async def delete_analysis_job(
         user_id = current_user["user_id"]
 
         # 작업 삭제
-        success = database_service.delete_job(db, job_id, user_id)
+        success = await async_database_service.delete_job(db, job_id, user_id)
         if not success:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
 
@@ -0,0 +1,125 @@
+import os
+import re
+import threading
+import logging
+from typing import Optional
+from botocore.exceptions import ClientError
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.s3.services.user_s3_service import user_s3_service
+
+logger = logging.getLogger(__name__)
+
+# 파일 경로/S3 키로 안전하게 쓸 수 있는 비디오 ID만 캐시
+_VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{6,64}$")
+
+
+class CaptionCache:
+    """
+    비디오 ID + 언어 기준 자막 캐시
+
+    1차: 프로세스 내 LRU
+    2차: 공유 저장소 (S3 CAPTION_CACHE_S3_PREFIX 또는 로컬 디스크)
+    """
+
+    def __init__(self):
+        self.enabled = settings.CAPTION_CACHE_ENABLED
+        self.backend = (settings.CAPTION_CACHE_BACKEND or "none").lower()
+        self.memory = LRUCache(max_entries=settings.CAPTION_CACHE_MAX_ENTRIES)
+
+    def get(self, video_id: Optional[str], locale: str) -> Optional[str]:
+        """캐시된 자막 조회 (없으면 None)"""
+        if not self._cacheable(video_id):
+            return None
+
+        key = self._key(video_id, locale)
+
+        caption = self.memory.get(key)
+        if caption is not None:
+            self._record("memory", "hit")
+            return caption
+        self._record("memory", "miss")
+
+        if self.backend == "none":
+            return None
+
+        try:
+            caption = self._shared_get(key)
+        except Exception as e:
+            logger.warning(f"공유 자막 캐시 조회 실패 (무시됨): {e}")
+            caption = None
+
+        if caption:
+            self._record(self.backend, "hit")
+            self.memory.set(key, caption)
+            return caption
+
+        self._record(self.backend, "miss")
+        return None
+
+    def set(self, video_id: Optional[str], locale: str, caption: str):
+        """자막을 두 계층 모두에 저장"""
+        if not self._cacheable(video_id) or not caption:
+            return
+
+        key = self._key(video_id, locale)
+        self.memory.set(key, caption)
+
+        if self.backend == "none":
+            return
+
+        try:
+            self._shared_set(key, caption)
+            logger.info(f"📦 자막 캐시 저장: {key} ({self.backend})")
+        except Exception as e:
+            logger.warning(f"공유 자막 캐시 저장 실패 (무시됨): {e}")
+
+    def _cacheable(self, video_id: Optional[str]) -> bool:
+        return self.enabled and bool(video_id) and bool(_VIDEO_ID_PATTERN.match(video_id))
+
+    def _key(self, video_id: str, locale: str) -> str:
+        return f"{locale}/{video_id}"
+
+    def _shared_get(self, key: str) -> Optional[str]:
+        if self.backend == "s3":
+            try:
+                response = user_s3_service.s3_client.get_object(
+                    Bucket=user_s3_service.bucket_name,
+                    Key=f"{settings.CAPTION_CACHE_S3_PREFIX}{key}.txt"
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                    return None
+                raise
+            return response["Body"].read().decode("utf-8")
+
+        if self.backend == "disk":
+            path = os.path.join(settings.CAPTION_CACHE_DIR, f"{key}.txt")
+            if not os.path.exists(path):
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+
+        return None
+
+    def _shared_set(self, key: str, caption: str):
+        if self.backend == "s3":
+            user_s3_service.upload_text_content(f"{settings.CAPTION_CACHE_S3_PREFIX}{key}.txt", caption)
+        elif self.backend == "disk":
+            path = os.path.join(settings.CAPTION_CACHE_DIR, f"{key}.txt")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(caption)
+            os.replace(tmp_path, path)
+
+    def _record(self, tier: str, result: str):
+        try:
+            from app.monitoring.services.metrics import caption_cache_requests_total
+            caption_cache_requests_total.labels(tier=tier, result=result).inc()
+        except Exception as e:
+            logger.warning(f"자막 캐시 메트릭 업데이트 실패: {e}")
+
+
+caption_cache = CaptionCache()
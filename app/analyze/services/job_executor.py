@@ -0,0 +1,125 @@
+import os
+import time
+import socket
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"분석 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+class AnalysisJobExecutor:
+    """
+    프로세스 전역 분석 작업 실행기
+
+    ANALYSIS_MAX_WORKERS개의 스레드에서 작업을 실행하고, 실행을 기다리는 작업이
+    ANALYSIS_QUEUE_MAX_SIZE개를 넘으면 JobQueueFullError로 거절합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="analysis")
+        # user_analysis_jobs.worker_id에 기록되는 이 프로세스의 식별자
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    def has_capacity(self) -> bool:
+        with self._lock:
+            return self._can_accept()
+
+    def submit(self, job_id: str, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """작업을 대기열에 추가 (가득 찼으면 JobQueueFullError)"""
+        with self._lock:
+            if not self._can_accept():
+                self._record_rejection()
+                raise JobQueueFullError(settings.ANALYSIS_QUEUE_RETRY_AFTER_SECONDS)
+            self._queued += 1
+            queued, running = self._queued, self._running
+            self._update_gauges()
+
+        enqueued_at = time.monotonic()
+        logger.info(f"📥 분석 작업 대기열 추가: {job_id} (대기: {queued}, 실행 중: {running})")
+        return self._executor.submit(self._run, job_id, enqueued_at, func, args, kwargs)
+
+    def idle_workers(self) -> int:
+        """대기 없이 바로 실행할 수 있는 작업 수"""
+        with self._lock:
+            return max(0, self.max_workers - self._running - self._queued)
+
+    def _can_accept(self) -> bool:
+        # 유휴 워커가 있으면 즉시 실행되므로 대기열 한도와 무관
+        idle_workers = self.max_workers - self._running - self._queued
+        return idle_workers > 0 or self._queued < self.max_queue_size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id: str, enqueued_at: float, func: Callable[..., Any], args: tuple, kwargs: dict):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._update_gauges()
+
+        waited = time.monotonic() - enqueued_at
+        self._record_wait(waited)
+        logger.info(f"▶️ 분석 작업 실행: {job_id} (대기 시간: {waited:.2f}초)")
+
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"분석 작업 실행 실패: {job_id} - {e}")
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._update_gauges()
+
+    def _update_gauges(self):
+        try:
+            from app.monitoring.services.metrics import analysis_queue_depth, analysis_running_jobs
+            analysis_queue_depth.set(self._queued)
+            analysis_running_jobs.set(self._running)
+        except Exception as e:
+            logger.warning(f"작업 대기열 메트릭 업데이트 실패: {e}")
+
+    def _record_wait(self, waited: float):
+        try:
+            from app.monitoring.services.metrics import analysis_queue_wait_seconds
+            analysis_queue_wait_seconds.observe(waited)
+        except Exception as e:
+            logger.warning(f"작업 대기열 메트릭 업데이트 실패: {e}")
+
+    def _record_rejection(self):
+        try:
+            from app.monitoring.services.metrics import analysis_queue_rejected_total
+            analysis_queue_rejected_total.inc()
+        except Exception as e:
+            logger.warning(f"작업 대기열 메트릭 업데이트 실패: {e}")
+
+
+job_executor = AnalysisJobExecutor(
+    max_workers=settings.ANALYSIS_MAX_WORKERS,
+    max_queue_size=settings.ANALYSIS_QUEUE_MAX_SIZE
+)
@@ -1,43 +1,268 @@
+import json
+import time
+import asyncio
+import threading
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple, Set
 from datetime import datetime
 
+from app.core.cache import LRUCache
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+
+class JobCancelledError(Exception):
+    """사용자가 취소한 작업 (워크플로우 노드/에이전트가 발생시켜 파이프라인을 중단)"""
+
+    def __init__(self, job_id: str, llm_calls_saved: int = 0):
+        super().__init__(f"작업이 취소되었습니다: {job_id}")
+        self.job_id = job_id
+        # 취소로 실행하지 않게 된 LLM 호출 수 (추정)
+        self.llm_calls_saved = llm_calls_saved
+
+
+def _is_active(progress: dict) -> bool:
+    """완료(100)/실패(-1)/취소되지 않은 진행 중 작업인지"""
+    return not progress.get("cancelled", False) and 0 <= progress.get("progress", 0) < 100
+
+
+class MemoryProgressBackend:
+    """프로세스 내 진행률 저장소 (LRU + TTL, 단일 Pod 환경용)"""
+
+    def __init__(self):
+        self._progress = LRUCache(max_entries=settings.PROGRESS_MAX_ENTRIES, ttl=settings.PROGRESS_TTL_SECONDS)
+        self._cancelled = LRUCache(max_entries=settings.PROGRESS_MAX_ENTRIES, ttl=settings.PROGRESS_TTL_SECONDS)
+        # job_id -> 구독자 (이벤트 루프, 큐) 목록
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._subscribers_lock = threading.Lock()
+
+    def set(self, job_id: str, progress: dict):
+        self._progress.set(job_id, progress)
+        self._notify(job_id, progress)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self._progress.get(job_id)
+
+    def delete(self, job_id: str):
+        self._progress.pop(job_id)
+        self._cancelled.pop(job_id)
+        self._notify(job_id, {"removed": True})
+
+    async def listen(self, job_id: str) -> AsyncIterator[dict]:
+        """진행률 변경 구독 (워커 스레드에서 갱신돼도 구독한 이벤트 루프로 전달)"""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._subscribers_lock:
+            self._subscribers.setdefault(job_id, []).append(subscriber)
+        try:
+            yield {"subscribed": True}
+            while True:
+                yield await subscriber[1].get()
+        finally:
+            with self._subscribers_lock:
+                subscribers = self._subscribers.get(job_id, [])
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(job_id, None)
+
+    def _notify(self, job_id: str, message: dict):
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers.get(job_id, []))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            except RuntimeError:
+                # 이미 종료된 이벤트 루프
+                pass
+
+    def set_cancelled(self, job_id: str):
+        self._cancelled.set(job_id, True)
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return job_id in self._cancelled
+
+    def clear_cancelled(self, job_id: str):
+        self._cancelled.pop(job_id)
+
+    def count_active(self) -> int:
+        return sum(1 for _, progress in self._progress.items() if _is_active(progress))
+
+
+class RedisProgressBackend:
+    """
+    Redis 진행률 저장소 (여러 Pod가 같은 진행률을 조회)
+
+    - job_progress:{job_id}: 진행률 JSON (SETEX, PROGRESS_TTL_SECONDS)
+    - job_cancelled:{job_id}: 취소 플래그 (SETEX)
+    - job_progress:active: 진행 중 작업 ZSET (score=마지막 갱신 시각, TTL이 지난 항목은 조회 시 정리)
+    - 갱신/삭제할 때마다 job_progress:{job_id} 채널로 PUBLISH
+    """
+
+    progress_prefix = "job_progress:"
+    cancelled_prefix = "job_cancelled:"
+    active_key = "job_progress:active"
+
+    def _client(self):
+        from app.core.redis_client import get_redis_client
+        return get_redis_client()
+
+    def set(self, job_id: str, progress: dict):
+        payload = json.dumps(progress, ensure_ascii=False)
+        ttl = settings.PROGRESS_TTL_SECONDS
+
+        pipe = self._client().pipeline()
+        pipe.setex(f"{self.progress_prefix}{job_id}", ttl, payload)
+        if _is_active(progress):
+            pipe.zadd(self.active_key, {job_id: time.time()})
+        else:
+            pipe.zrem(self.active_key, job_id)
+        pipe.publish(f"{self.progress_prefix}{job_id}", payload)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        raw = self._client().get(f"{self.progress_prefix}{job_id}")
+        return json.loads(raw) if raw else None
+
+    def delete(self, job_id: str):
+        pipe = self._client().pipeline()
+        pipe.delete(f"{self.progress_prefix}{job_id}", f"{self.cancelled_prefix}{job_id}")
+        pipe.zrem(self.active_key, job_id)
+        pipe.publish(f"{self.progress_prefix}{job_id}", json.dumps({"removed": True}))
+        pipe.execute()
+
+    async def listen(self, job_id: str) -> AsyncIterator[dict]:
+        """job_progress:{job_id} 채널 구독 (다른 Pod/워커의 갱신도 수신)"""
+        from app.core.redis_client import get_async_redis_client
+        channel = f"{self.progress_prefix}{job_id}"
+        pubsub = get_async_redis_client().pubsub()
+        await pubsub.subscribe(channel)
+        subscribed = False
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "subscribe":
+                    # 서버의 SUBSCRIBE 확인 응답 (재연결 시 다시 올 수 있으므로 한 번만 전달)
+                    if not subscribed:
+                        subscribed = True
+                        yield {"subscribed": True}
+                elif message.get("type") == "message":
+                    yield json.loads(message["data"])
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+    def set_cancelled(self, job_id: str):
+        pipe = self._client().pipeline()
+        pipe.setex(f"{self.cancelled_prefix}{job_id}", settings.PROGRESS_TTL_SECONDS, "1")
+        pipe.zrem(self.active_key, job_id)
+        pipe.execute()
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return bool(self._client().exists(f"{self.cancelled_prefix}{job_id}"))
+
+    def clear_cancelled(self, job_id: str):
+        self._client().delete(f"{self.cancelled_prefix}{job_id}")
+
+    def count_active(self) -> int:
+        pipe = self._client().pipeline()
+        pipe.zremrangebyscore(self.active_key, "-inf", time.time() - settings.PROGRESS_TTL_SECONDS)
+        pipe.zcard(self.active_key)
+        return pipe.execute()[1]
+
+
 class SimpleStateManager:
-    """메모리 기반 상태 관리자"""
+    """
+    작업 진행률/취소 상태 관리자
+
+    PROGRESS_BACKEND 설정에 따라 프로세스 내 LRU(memory) 또는 Redis(redis)에 저장합니다.
+    취소 플래그는 모든 프로세스가 공유하고, 로컬 중단(stop_locally)은 이 프로세스의 실행만 멈춥니다.
+    """
     
     def __init__(self):
-        self._progress_store = {}
+        if (settings.PROGRESS_BACKEND or "").lower() == "redis":
+            self.backend = RedisProgressBackend()
+        else:
+            self.backend = MemoryProgressBackend()
+        self._local_stops: Set[str] = set()
+        self._local_stops_lock = threading.Lock()
     
     def update_progress(self, job_id: str, progress: int, message: str = ""):
         """진행률 업데이트"""
-        self._progress_store[job_id] = {
+        entry = {
             "progress": progress,
             "message": message,
             "updated_at": datetime.utcnow().isoformat()
         }
+        # 진행률 갱신으로 취소 표시가 사라지지 않도록 유지
+        if self.is_cancelled(job_id):
+            entry["cancelled"] = True
+        self.backend.set(job_id, entry)
         logger.info(f"Job {job_id}: {progress}% - {message}")
     
     def get_progress(self, job_id: str) -> Optional[dict]:
         """진행률 조회"""
-        return self._progress_store.get(job_id, {"progress": 0, "message": "처리 중..."})
+        return self.backend.get(job_id) or {"progress": 0, "message": "처리 중..."}
     
     def remove_user_active_job(self, user_id: str, job_id: str):
         """작업 완료 시 진행률 정보 제거"""
-        if job_id in self._progress_store:
-            del self._progress_store[job_id]
-            logger.info(f"진행률 정보 제거: {job_id}")
+        self.backend.delete(job_id)
+        logger.info(f"진행률 정보 제거: {job_id}")
     
     def cancel_job(self, job_id: str):
-        """작업 취소 요청"""
-        if job_id in self._progress_store:
-            self._progress_store[job_id]["cancelled"] = True
-            self._progress_store[job_id]["message"] = "취소 요청됨"
-            logger.info(f"작업 취소 요청: {job_id}")
+        """작업 취소 요청 (아직 시작 전인 작업도 취소됨)"""
+        self.backend.set_cancelled(job_id)
+        progress = self.backend.get(job_id)
+        if progress:
+            self.backend.set(job_id, {**progress, "cancelled": True, "message": "취소 요청됨"})
+        logger.info(f"작업 취소 요청: {job_id}")
     
+    def clear_cancelled(self, job_id: str):
+        """이전 취소 플래그 제거 (재개/재대기열 시 오래된 플래그로 바로 중단되지 않도록)"""
+        try:
+            self.backend.clear_cancelled(job_id)
+        except Exception as e:
+            logger.warning(f"취소 플래그 제거 실패 (무시됨): {e}")
+
+    def stop_locally(self, job_id: str):
+        """이 프로세스에서 실행 중인 작업만 중단 (다른 워커/재개 실행에는 영향 없음)"""
+        with self._local_stops_lock:
+            self._local_stops.add(job_id)
+        logger.info(f"작업 로컬 중단 요청: {job_id}")
+
+    def clear_local_stop(self, job_id: str):
+        """로컬 중단 표시 제거 (실행이 끝난 뒤 호출)"""
+        with self._local_stops_lock:
+            self._local_stops.discard(job_id)
+
     def is_cancelled(self, job_id: str) -> bool:
-        """작업 취소 여부 확인"""
-        return self._progress_store.get(job_id, {}).get("cancelled", False)
+        """작업 취소(또는 로컬 중단) 여부 확인 (저장소 오류 시 취소되지 않은 것으로 간주)"""
+        if not job_id:
+            return False
+        with self._local_stops_lock:
+            if job_id in self._local_stops:
+                return True
+        try:
+            return self.backend.is_cancelled(job_id)
+        except Exception as e:
+            logger.warning(f"취소 여부 조회 실패 (무시됨): {e}")
+            return False
+
+    def raise_if_cancelled(self, job_id: str, llm_calls_saved: int = 0):
+        """취소된 작업이면 JobCancelledError 발생"""
+        if self.is_cancelled(job_id):
+            raise JobCancelledError(job_id, llm_calls_saved)
+
+    def listen(self, job_id: str) -> AsyncIterator[dict]:
+        """
+        진행률 변경 구독
+
+        구독이 등록(Redis는 SUBSCRIBE 확인)되면 먼저 {"subscribed": True}를 한 번 전달하고,
+        이후 진행률 갱신 시 진행률 dict를, 작업 완료로 진행률이 제거되면 {"removed": True}를 전달합니다.
+        """
+        return self.backend.listen(job_id)
+
+    def count_active_jobs(self) -> int:
+        """진행 중인 작업 수 (완료/실패/취소/만료 제외)"""
+        return self.backend.count_active()
 
-state_manager = SimpleStateManager()
\ No newline at end of file
+state_manager = SimpleStateManager()
@@ -0,0 +1,86 @@
+import json
+import threading
+import logging
+from typing import Any, Dict, List
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemorySummaryStreamBackend:
+    """프로세스 내 이벤트 버퍼 (단일 Pod 환경용)"""
+
+    def __init__(self):
+        self._events = LRUCache(max_entries=1024, ttl=settings.SUMMARY_STREAM_TTL_SECONDS)
+        self._lock = threading.Lock()
+
+    def append(self, job_id: str, event: Dict[str, Any]):
+        with self._lock:
+            events = self._events.get(job_id)
+            if events is None:
+                events = []
+                self._events.set(job_id, events)
+            events.append(event)
+
+    def read(self, job_id: str, offset: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list((self._events.get(job_id) or [])[offset:])
+
+
+class RedisSummaryStreamBackend:
+    """Redis 리스트 기반 이벤트 버퍼 (여러 Pod가 같은 작업의 스트림을 읽을 수 있음)"""
+
+    prefix = "summary_stream:"
+
+    def append(self, job_id: str, event: Dict[str, Any]):
+        from app.core.redis_client import get_redis_client
+        key = f"{self.prefix}{job_id}"
+        pipe = get_redis_client().pipeline()
+        pipe.rpush(key, json.dumps(event, ensure_ascii=False))
+        pipe.expire(key, settings.SUMMARY_STREAM_TTL_SECONDS)
+        pipe.execute()
+
+    def read(self, job_id: str, offset: int) -> List[Dict[str, Any]]:
+        from app.core.redis_client import get_redis_client
+        return [json.loads(item) for item in get_redis_client().lrange(f"{self.prefix}{job_id}", offset, -1)]
+
+
+class SummaryStream:
+    """
+    작업별 요약 스트림 채널
+
+    이벤트 종류:
+      - delta: 새로 생성된 요약 텍스트 조각
+      - reset: 요약을 다시 생성하므로 지금까지 받은 텍스트를 버림
+      - done: 요약 생성 종료
+    """
+
+    def __init__(self):
+        if (settings.SUMMARY_STREAM_BACKEND or "").lower() == "redis":
+            self.backend = RedisSummaryStreamBackend()
+        else:
+            self.backend = MemorySummaryStreamBackend()
+
+    def publish(self, job_id: str, text: str):
+        self._append(job_id, {"type": "delta", "text": text})
+
+    def reset(self, job_id: str):
+        self._append(job_id, {"type": "reset"})
+
+    def finish(self, job_id: str):
+        self._append(job_id, {"type": "done"})
+
+    def read(self, job_id: str, offset: int = 0) -> List[Dict[str, Any]]:
+        """offset 이후의 이벤트 조회"""
+        return self.backend.read(job_id, offset)
+
+    def _append(self, job_id: str, event: Dict[str, Any]):
+        try:
+            self.backend.append(job_id, event)
+        except Exception as e:
+            logger.warning(f"요약 스트림 전송 실패 (무시됨): {e}")
+
+
+summary_stream = SummaryStream()
@@ -2,17 +2,23 @@
 import uuid
 import json
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.llm_cache import bypass_llm_cache
 from app.analyze.workflow.youtube_workflow import YouTubeReporterWorkflow
+from app.database.core.database import SessionLocal
 from app.database.services.database_service import database_service
+from app.database.services.async_database_service import async_database_service
+from app.database.models.database_models import UserAnalysisJob
 from app.s3.services.user_s3_service import user_s3_service
 from app.s3.services.s3_service import s3_service
 from app.audio.services.audio_service import audio_service
 from app.analyze.services.state_manager import state_manager
+from app.analyze.services.job_executor import job_executor
 from app.analyze.services.youtube_metadata_service import youtube_metadata_service
 import logging
 # 
@@ -27,15 +33,27 @@ class YouTubeReporterService:
         self.workflow = YouTubeReporterWorkflow()
         logger.info("YouTube Reporter 서비스 초기화 완료")
 
-    async def create_analysis_job(self, user_id: str, youtube_url: str, db: Session, include_audio: bool = True) -> str:
-        """새로운 YouTube 분석 작업 생성"""
+    async def create_analysis_job(self, user_id: str, youtube_url: str, db: AsyncSession, include_audio: bool = True,
+                                  force_refresh: bool = False, worker_id: Optional[str] = None) -> str:
+        """
+        새로운 YouTube 분석 작업 생성
+
+        worker_id를 지정하면 해당 프로세스가 직접 실행하는 작업으로 기록되어 대기열 워커가 가져가지 않습니다.
+        """
         try:
             # 데이터베이스에 작업 생성
-            job = database_service.create_analysis_job(
+            job = await async_database_service.create_analysis_job(
                 db=db,
                 user_id=user_id,
                 job_type="youtube_reporter",
-                input_data={"youtube_url": youtube_url, "include_audio": include_audio}
+                input_data={
+                    "youtube_url": youtube_url,
+                    "include_audio": include_audio,
+                    "force_refresh": force_refresh
+                },
+                video_id=youtube_metadata_service.extract_video_id(youtube_url),
+                pipeline_version=settings.ANALYSIS_PIPELINE_VERSION,
+                worker_id=worker_id
             )
 
             job_id = str(job.id)
@@ -46,72 +64,117 @@ class YouTubeReporterService:
             logger.error(f"작업 생성 실패: {str(e)}")
             raise
 
+    def run_job(self, job_id: str, user_id: str, youtube_url: str, include_audio: bool = True,
+                force_refresh: bool = False, resume: bool = False):
+        """작업 실행기/대기열 워커 스레드에서 분석 실행 (독립적인 DB 세션, 스레드별 이벤트 루프)"""
+        db = SessionLocal()
+        try:
+            asyncio.run(self.process_youtube_analysis(
+                job_id=job_id,
+                user_id=user_id,
+                youtube_url=youtube_url,
+                db=db,
+                include_audio=include_audio,
+                force_refresh=force_refresh,
+                resume=resume
+            ))
+        except Exception as e:
+            logger.error(f"백그라운드 YouTube 분석 실패: {job_id} - {str(e)}")
+        finally:
+            db.close()
+
     async def process_youtube_analysis(self, job_id: str, user_id: str, youtube_url: str,
-                                       db: Session, include_audio: bool = True) -> Dict[str, Any]:
-        """YouTube 분석 실행"""
+                                       db: Session, include_audio: bool = True,
+                                       force_refresh: bool = False, resume: bool = False) -> Dict[str, Any]:
+        """YouTube 분석 실행 (resume이면 워크플로우 체크포인트에서 이어서 실행)"""
         try:
             logger.info(f"🎬 YouTube 분석 시작: {job_id}")
 
-            # LangGraph 워크플로우를 별도 스레드에서 실행 (블로킹 방지)
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                result = await loop.run_in_executor(
-                    executor,
-                    self.workflow.process,
-                    youtube_url,
-                    job_id,
-                    user_id
-                )
-
-            # 결과를 S3에 저장
-            s3_info = await self._save_report_to_s3(
-                user_id=user_id,
-                job_id=job_id,
-                result=result,
-                youtube_url=youtube_url
-            )
-
-            # 오디오 생성 (요청 시)
-            audio_info = None
-            if include_audio and result.get("success"):
-                try:
-                    audio_info = await self._generate_audio_summary(
-                        user_id=user_id,
-                        job_id=job_id,
-                        summary=result.get("summary", "")
-                    )
-                except Exception as e:
-                    logger.warning(f"오디오 생성 실패 (무시됨): {e}")
-                    audio_info = {"success": False, "error": str(e)}
+            # 대기 중에 취소된 작업은 시작하지 않음
+            if state_manager.is_cancelled(job_id):
+                logger.info(f"🛑 시작 전에 취소된 작업: {job_id}")
+                state_manager.remove_user_active_job(user_id, job_id)
+                return {"success": False, "cancelled": True, "job_id": job_id}
 
-            # 데이터베이스 업데이트
-            database_service.update_job_status(
-                db=db,
-                job_id=job_id,
-                status="completed" if result.get("success") else "failed",
-                result_s3_key=s3_info.get("s3_key") if s3_info.get("success") else None
-            )
+            # 같은 영상의 최근 완료 리포트가 있으면 파이프라인 없이 재사용
+            reusable = None
+            if settings.REPORT_REUSE_ENABLED and not force_refresh and not resume:
+                reusable = self._find_reusable_report(db, job_id, youtube_url)
 
-            # S3 보고서 정보를 데이터베이스에 저장
-            if s3_info.get("success"):
-                database_service.create_user_report(
+            if reusable:
+                result, s3_info, audio_info = await self._reuse_report(
                     db=db,
+                    source_job=reusable[0],
+                    report_data=reusable[1],
+                    user_id=user_id,
                     job_id=job_id,
+                    youtube_url=youtube_url,
+                    include_audio=include_audio
+                )
+            else:
+                # 분석 작업 실행기(job_executor)의 워커 스레드에서 호출되므로 직접 실행
+                # 강제 새로고침/재시도는 이전 LLM 응답을 재생하지 않도록 캐시 조회를 건너뜀
+                with bypass_llm_cache(force_refresh or resume):
+                    result = self.workflow.process(youtube_url, job_id, user_id, resume=resume)
+
+                if result.get("cancelled"):
+                    # 취소 API가 이미 DB 상태를 cancelled로 바꿨으므로 저장/오디오 생성 없이 종료
+                    logger.info(f"🛑 YouTube 분석 취소됨: {job_id}")
+                    state_manager.remove_user_active_job(user_id, job_id)
+                    return result
+
+                # 결과를 S3에 저장
+                s3_info = await self._save_report_to_s3(
                     user_id=user_id,
-                    title=result.get("title", "YouTube 분석 리포트"),
-                    s3_key=s3_info["s3_key"],
-                    file_type="json"
+                    job_id=job_id,
+                    result=result,
+                    youtube_url=youtube_url
                 )
 
-            # 오디오 정보를 데이터베이스에 저장
+                # 오디오 생성 (요청 시)
+                audio_info = None
+                if include_audio and result.get("success"):
+                    try:
+                        audio_info = await self._generate_audio_summary(
+                            user_id=user_id,
+                            job_id=job_id,
+                            summary=result.get("summary", "")
+                        )
+                    except Exception as e:
+                        logger.warning(f"오디오 생성 실패 (무시됨): {e}")
+                        audio_info = {"success": False, "error": str(e)}
+
+            # 데이터베이스 업데이트 (작업 상태 + S3 보고서 + 오디오 정보를 한 트랜잭션으로 저장)
+            report_row = None
+            if s3_info.get("success"):
+                report_row = {
+                    "title": result.get("title", "YouTube 분석 리포트"),
+                    "s3_key": s3_info["s3_key"],
+                    "file_type": "json",
+                    "youtube_metadata": s3_info.get("metadata")
+                }
+
+            audio_row = None
             if audio_info and audio_info.get("success"):
-                database_service.create_user_audio(
-                    db=db,
-                    job_id=job_id,
-                    user_id=user_id,
-                    s3_key=audio_info["audio_s3_key"],
-                    duration=audio_info.get("duration_estimate", 0)
-                )
+                audio_row = {
+                    "s3_key": audio_info["audio_s3_key"],
+                    "duration": audio_info.get("duration_estimate", 0)
+                }
+
+            saved = database_service.complete_job(
+                db=db,
+                job_id=job_id,
+                user_id=user_id,
+                status="completed" if result.get("success") else "failed",
+                result_s3_key=s3_info.get("s3_key") if s3_info.get("success") else None,
+                report=report_row,
+                audio=audio_row,
+                reused_from_job_id=reusable[0].id if reusable else None,
+                worker_id=job_executor.worker_id
+            )
+            if not saved:
+                # 저장 중에 취소됐거나 하트비트가 끊겨 다른 워커가 가져간 작업: 상태/보고서를 덮어쓰지 않음
+                logger.warning(f"작업이 더 이상 이 워커 소유의 진행 중 작업이 아니어서 결과를 기록하지 않습니다: {job_id}")
 
             # Redis 정리
             try:
@@ -135,8 +198,13 @@ class YouTubeReporterService:
         except Exception as e:
             logger.error(f"YouTube 분석 실패: {job_id} - {str(e)}")
 
-            # 실패 시 데이터베이스 업데이트
-            database_service.update_job_status(db=db, job_id=job_id, status="failed")
+            # 실패 시 데이터베이스 업데이트 (취소됐거나 다른 워커가 가져간 작업은 그대로 둠)
+            try:
+                db.rollback()
+                database_service.complete_job(db=db, job_id=job_id, user_id=user_id, status="failed",
+                                              worker_id=job_executor.worker_id)
+            except Exception as db_error:
+                logger.error(f"작업 실패 상태 저장 실패: {db_error}")
 
             # Redis 정리
             try:
@@ -146,14 +214,106 @@ class YouTubeReporterService:
 
             raise
 
+    def can_resume(self, job_id: str) -> bool:
+        """체크포인트에서 이어서 실행할 수 있는 작업인지 확인"""
+        try:
+            return self.workflow.get_resume_config(job_id) is not None
+        except Exception as e:
+            logger.warning(f"체크포인트 조회 실패: {e}")
+            return False
+
+    def _find_reusable_report(self, db: Session, job_id: str,
+                              youtube_url: str) -> Optional[Tuple[UserAnalysisJob, Dict[str, Any]]]:
+        """같은 영상 + 파이프라인 버전으로 신선도 기간 내 완료된 리포트 조회"""
+        try:
+            video_id = youtube_metadata_service.extract_video_id(youtube_url)
+            if not video_id:
+                return None
+
+            since = datetime.utcnow() - timedelta(hours=settings.REPORT_REUSE_MAX_AGE_HOURS)
+            source_job = database_service.find_reusable_job(
+                db=db,
+                video_id=video_id,
+                pipeline_version=settings.ANALYSIS_PIPELINE_VERSION,
+                since=since,
+                exclude_job_id=job_id
+            )
+
+            report_data = None
+            if source_job:
+                content = user_s3_service.get_file_content(source_job.result_s3_key)
+                report_data = json.loads(content) if content else None
+
+            self._record_reuse("hit" if report_data else "miss")
+            if not report_data:
+                return None
+
+            logger.info(f"♻️ 재사용 가능한 리포트 발견: {source_job.id} (video_id={video_id})")
+            return source_job, report_data
+
+        except Exception as e:
+            logger.warning(f"리포트 재사용 조회 실패 (새로 분석합니다): {e}")
+            return None
+
+    async def _reuse_report(self, db: Session, source_job: UserAnalysisJob, report_data: Dict[str, Any],
+                            user_id: str, job_id: str, youtube_url: str, include_audio: bool):
+        """완료된 리포트와 오디오를 새 작업(사용자) 소유로 복제"""
+        result = report_data.get("report", {})
+        result["process_info"] = {
+            **result.get("process_info", {}),
+            "user_id": user_id,
+            "job_id": job_id,
+            "reused_from_job_id": source_job.id
+        }
+
+        s3_info = await self._save_report_to_s3(
+            user_id=user_id,
+            job_id=job_id,
+            result=result,
+            youtube_url=youtube_url,
+            youtube_metadata=report_data.get("metadata", {}),
+            extra_metadata={"reused_from_job_id": source_job.id}
+        )
+
+        audio_info = None
+        if include_audio and result.get("success"):
+            source_audio = database_service.get_job_audio(db, source_job.id)
+            if source_audio:
+                # 원본 사용자가 파일을 지워도 영향이 없도록 새 사용자 경로로 복사 (S3 서버 측 복사)
+                try:
+                    audio_info = {
+                        "success": True,
+                        "audio_s3_key": user_s3_service.copy_user_audio(source_audio.s3_key, user_id, job_id),
+                        "duration_estimate": source_audio.duration or 0,
+                        "reused": True
+                    }
+                except Exception as e:
+                    logger.warning(f"오디오 복사 실패 (오디오 없이 진행): {e}")
+
+        try:
+            state_manager.update_progress(job_id, 100, "✅ 분석 완료! (기존 결과 재사용)")
+        except Exception as e:
+            logger.warning(f"진행률 업데이트 실패 (무시됨): {e}")
+
+        return result, s3_info, audio_info
+
+    def _record_reuse(self, result: str):
+        try:
+            from app.monitoring.services.metrics import report_reuse_total
+            report_reuse_total.labels(result=result).inc()
+        except Exception as e:
+            logger.warning(f"리포트 재사용 메트릭 업데이트 실패: {e}")
+
     async def _save_report_to_s3(self, user_id: str, job_id: str, result: Dict[str, Any],
-                                 youtube_url: str) -> Dict[str, Any]:
+                                 youtube_url: str, youtube_metadata: Optional[Dict[str, Any]] = None,
+                                 extra_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """리포트를 S3에 저장"""
         try:
             logger.info(f"📤 S3에 리포트 저장 중: {job_id}")
 
-            # YouTube 메타데이터 추출
-            youtube_metadata = youtube_metadata_service.get_youtube_metadata(youtube_url)
+            # YouTube 메타데이터 추출 (재사용 시 원본 리포트의 메타데이터 사용)
+            if youtube_metadata is None:
+                youtube_metadata = youtube_metadata_service.get_youtube_metadata(youtube_url)
             
             # JSON 형태로 리포트 저장
             report_data = {
@@ -166,21 +326,22 @@ class YouTubeReporterService:
                     "service": "youtube_reporter",
                     "analysis_type": "youtube_analysis",
                     "status": "completed",
+                    "pipeline_version": settings.ANALYSIS_PIPELINE_VERSION,
                     # YouTube 메타데이터 추가
                     "youtube_title": youtube_metadata.get("youtube_title", ""),
                     "youtube_channel": youtube_metadata.get("youtube_channel", ""),
                     "youtube_duration": youtube_metadata.get("youtube_duration", ""),
                     "youtube_thumbnail": youtube_metadata.get("youtube_thumbnail", ""),
-                    "video_id": youtube_metadata.get("video_id", "")
+                    "video_id": youtube_metadata.get("video_id", ""),
+                    **(extra_metadata or {})
                 }
             }
 
             # S3에 업로드
-            s3_key = user_s3_service.upload_user_report(
+            s3_key = user_s3_service.upload_report_data(
                 user_id=user_id,
                 job_id=job_id,
-                content=json.dumps(report_data, ensure_ascii=False, indent=2),
-                file_type="json"
+                report_data=report_data
             )
 
 
@@ -189,7 +350,9 @@ class YouTubeReporterService:
             return {
                 "success": True,
                 "s3_key": s3_key,
-                "bucket": user_s3_service.bucket_name
+                "bucket": user_s3_service.bucket_name,
+                # 보고서 목록 인덱스(user_reports)에 함께 저장
+                "metadata": report_data["metadata"]
             }
 
         except Exception as e:
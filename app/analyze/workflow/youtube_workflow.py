@@ -1,17 +1,78 @@
 # app/agents/graph_workflow.py
-from typing import TypedDict, Dict, Any, List
+import time
+from typing import TypedDict, Dict, Any, List, Callable, Optional
+from typing_extensions import Annotated
 from langgraph.graph import StateGraph
 from app.analyze.agents.caption_extractor import CaptionAgent
 from app.analyze.agents.content_summarizer import SummaryAgent
 from app.analyze.agents.visualization_analyzer import VisualizationAnalyzer
 from app.analyze.agents.visualization_generator import SmartVisualAgent
 from app.analyze.agents.report_builder import ReportAgent
-from app.analyze.services.state_manager import state_manager
+from app.analyze.services.state_manager import state_manager, JobCancelledError
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# 노드별 LLM 호출 수 (취소로 절약된 호출 수 추정용, visual_node는 시각화 요청 수)
+NODE_LLM_CALLS = {
+    "summary_node": 1,
+    "structure_node": 1,
+    "visualization_analysis_node": 1,
+    "visual_node": None,
+}
+DEFAULT_VISUAL_LLM_CALLS = 3
+
+
+def _merge_timings(left: Dict[str, float], right: Dict[str, float]) -> Dict[str, float]:
+    """병렬 노드가 각자 기록한 실행 시간을 합침"""
+    return {**(left or {}), **(right or {})}
+
+
+def _create_checkpointer():
+    """WORKFLOW_CHECKPOINTER 설정에 따른 LangGraph 체크포인터 (none이면 None)"""
+    backend = (settings.WORKFLOW_CHECKPOINTER or "none").lower()
+
+    if backend == "redis":
+        from langgraph.checkpoint.redis import RedisSaver
+        # 재개하지 않은 실패 작업의 체크포인트는 TTL이 지나면 Redis에서 만료
+        saver = RedisSaver(
+            redis_url=settings.REDIS_URL,
+            ttl={"default_ttl": settings.WORKFLOW_CHECKPOINT_TTL_MINUTES, "refresh_on_read": True}
+        )
+        saver.setup()
+        return saver
+
+    if backend == "memory":
+        from langgraph.checkpoint.memory import MemorySaver
+        return MemorySaver()
+
+    return None
+
+
+# RedisSaver 키 접두사 ({prefix}:{thread_id}:{checkpoint_ns}:...)
+REDIS_CHECKPOINT_PREFIXES = ("checkpoint", "checkpoint_blob", "checkpoint_write")
+
+
+def _delete_redis_checkpoints(thread_id: str) -> int:
+    """Redis에 저장된 스레드(작업)의 체크포인트/블롭/쓰기 키를 모두 삭제"""
+    from app.core.redis_client import get_redis_client
+    client = get_redis_client()
+
+    deleted = 0
+    for prefix in REDIS_CHECKPOINT_PREFIXES:
+        batch = []
+        for key in client.scan_iter(match=f"{prefix}:{thread_id}:*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += client.delete(*batch)
+    return deleted
+
+
 class GraphState(TypedDict):
     """워크플로우 상태 정의 - taeho 백엔드 통합 버전"""
     job_id: str
@@ -19,10 +80,12 @@ class GraphState(TypedDict):
     youtube_url: str
     caption: str
     summary: str
+    structured_sections: List[Dict[str, Any]]
     visualization_requests: List[Dict[str, Any]]
     visual_sections: List[Dict[str, Any]]
     report_result: Dict[str, Any]
     final_output: Dict[str, Any]
+    node_timings: Annotated[Dict[str, float], _merge_timings]
 
 
 class YouTubeReporterWorkflow:
@@ -35,31 +98,163 @@ class YouTubeReporterWorkflow:
         self.visualization_analyzer = VisualizationAnalyzer()
         self.visual_agent = SmartVisualAgent()
         self.report_agent = ReportAgent()
+        self.checkpointer = self._init_checkpointer()
+        # 실패한 작업의 체크포인트를 재개용으로 남길지 (만료되는 공유 저장소일 때만)
+        self.keep_failed_checkpoints = (
+            self.checkpointer is not None and (settings.WORKFLOW_CHECKPOINTER or "").lower() == "redis"
+        )
         self.graph = self._build_graph()
         logger.info("✅ YouTube Reporter 워크플로우 초기화 완료")
 
     def _build_graph(self):
-        """LangGraph 워크플로우 구성"""
+        """
+        LangGraph 워크플로우 구성
+
+        caption → summary 이후 두 갈래로 병렬 실행한 뒤 report_node에서 합류합니다.
+          - summary → visualization_analysis → visual
+          - summary → structure (요약 섹션 구조화)
+        """
         builder = StateGraph(state_schema=GraphState)
 
         # 노드 추가
-        builder.add_node("caption_node", self.caption_agent)
-        builder.add_node("summary_node", self.summary_agent)
-        builder.add_node("visualization_analysis_node", self.visualization_analyzer)
-        builder.add_node("visual_node", self.visual_agent)
-        builder.add_node("report_node", self.report_agent)
-        builder.add_node("finalize_node", self._finalize_result)
-
-        # 엣지 연결 - 순차적 실행
+        builder.add_node("caption_node", self._timed("caption_node", self.caption_agent.invoke))
+        builder.add_node("summary_node", self._timed("summary_node", self.summary_agent.invoke))
+        builder.add_node("structure_node", self._timed("structure_node", self.report_agent.structure))
+        builder.add_node("visualization_analysis_node",
+                         self._timed("visualization_analysis_node", self.visualization_analyzer.invoke))
+        builder.add_node("visual_node", self._timed("visual_node", self.visual_agent.invoke))
+        builder.add_node("report_node", self._timed("report_node", self.report_agent.invoke))
+        builder.add_node("finalize_node", self._timed("finalize_node", self._finalize_result))
+
+        # 엣지 연결
         builder.set_entry_point("caption_node")
         builder.add_edge("caption_node", "summary_node")
+
+        # 요약 이후 병렬 분기
         builder.add_edge("summary_node", "visualization_analysis_node")
+        builder.add_edge("summary_node", "structure_node")
         builder.add_edge("visualization_analysis_node", "visual_node")
-        builder.add_edge("visual_node", "report_node")
+
+        # 두 분기가 모두 끝나면 report_node에서 병합 (_merge_visualizations)
+        builder.add_edge(["visual_node", "structure_node"], "report_node")
         builder.add_edge("report_node", "finalize_node")
         builder.add_edge("finalize_node", "__end__")
 
-        return builder.compile()
+        return builder.compile(checkpointer=self.checkpointer)
+
+    def _init_checkpointer(self):
+        try:
+            checkpointer = _create_checkpointer()
+        except Exception as e:
+            logger.warning(f"체크포인터 초기화 실패 (체크포인트 없이 실행): {e}")
+            return None
+
+        if checkpointer:
+            logger.info(f"💾 워크플로우 체크포인터: {type(checkpointer).__name__}")
+        return checkpointer
+
+    def _thread_config(self, job_id: str) -> Optional[dict]:
+        """작업 ID를 thread_id로 사용하는 체크포인트 설정 (체크포인터가 없으면 None)"""
+        if not self.checkpointer or not job_id:
+            return None
+        return {"configurable": {"thread_id": job_id}}
+
+    def _failed_node(self, values: dict) -> Optional[str]:
+        """완료된 실행에서 다시 실행해야 할 노드 (실패가 없으면 None)"""
+        if values.get("report_result", {}).get("metadata", {}).get("error"):
+            return "report_node"
+        return None
+
+    def get_resume_config(self, job_id: str) -> Optional[dict]:
+        """
+        작업을 이어서 실행할 체크포인트 설정 조회
+
+        - 중단된 실행(예외, 워커 종료): 마지막 체크포인트에서 남은 노드부터
+        - 끝까지 실행됐지만 실패한 실행: 실패한 노드 직전 체크포인트부터
+
+        Returns:
+            graph.invoke(None, config)에 사용할 설정 (이어서 실행할 지점이 없으면 None)
+        """
+        config = self._thread_config(job_id)
+        if not config:
+            return None
+
+        snapshot = self.graph.get_state(config)
+        if not snapshot.values:
+            return None
+        if snapshot.next:
+            return snapshot.config
+
+        failed_node = self._failed_node(snapshot.values)
+        if not failed_node:
+            return None
+
+        for past in self.graph.get_state_history(config):
+            if failed_node in past.next:
+                return past.config
+        return None
+
+    def _clear_checkpoints(self, job_id: str):
+        """더 이상 재개하지 않을 작업의 체크포인트 삭제"""
+        config = self._thread_config(job_id)
+        if not config:
+            return
+        try:
+            if (settings.WORKFLOW_CHECKPOINTER or "").lower() == "redis":
+                # langgraph-checkpoint-redis 0.0.6 RedisSaver는 delete_thread를 구현하지 않으므로 키를 직접 삭제
+                _delete_redis_checkpoints(job_id)
+            else:
+                self.checkpointer.delete_thread(job_id)
+        except Exception as e:
+            logger.warning(f"체크포인트 삭제 실패 (무시됨): {e}")
+
+    def _timed(self, node_name: str, func: Callable) -> Callable:
+        """노드 실행 시간을 측정하여 state(node_timings)와 메트릭에 기록하는 래퍼"""
+        def node(state: dict, config=None) -> dict:
+            job_id = state.get("job_id")
+            # 노드 시작 전 취소 확인: 이 노드와 이후 노드의 LLM 호출을 모두 건너뜀
+            state_manager.raise_if_cancelled(job_id, self._remaining_llm_calls(state))
+
+            start_time = time.monotonic()
+            try:
+                update = func(state, config)
+            except JobCancelledError as e:
+                # 노드 실행 중 취소: 노드가 건너뛴 호출(e.llm_calls_saved) + 이후 노드의 호출
+                e.llm_calls_saved += self._remaining_llm_calls(state, exclude=node_name)
+                raise
+            elapsed = time.monotonic() - start_time
+
+            try:
+                from app.monitoring.services.metrics import workflow_node_duration
+                workflow_node_duration.labels(node=node_name).observe(elapsed)
+            except Exception as e:
+                logger.warning(f"워크플로우 메트릭 업데이트 실패: {e}")
+
+            logger.info(f"⏱️ {node_name} 완료: {elapsed:.2f}초")
+            return {**update, "node_timings": {node_name: round(elapsed, 3)}}
+
+        return node
+
+    def _remaining_llm_calls(self, state: dict, exclude: str = None) -> int:
+        """아직 실행되지 않은 노드의 예상 LLM 호출 수"""
+        completed = state.get("node_timings") or {}
+        remaining = 0
+        for node_name, calls in NODE_LLM_CALLS.items():
+            if node_name in completed or node_name == exclude:
+                continue
+            if calls is None:
+                calls = len(state.get("visualization_requests") or []) or DEFAULT_VISUAL_LLM_CALLS
+            remaining += calls
+        return remaining
+
+    def _record_cancellation(self, e: JobCancelledError):
+        logger.info(f"🛑 작업 취소로 파이프라인 중단: {e.job_id} (절약된 LLM 호출 약 {e.llm_calls_saved}회)")
+        try:
+            from app.monitoring.services.metrics import llm_calls_saved_total, youtube_job_total
+            llm_calls_saved_total.inc(e.llm_calls_saved)
+            youtube_job_total.labels(status="cancelled").inc()
+        except Exception as metric_error:
+            logger.warning(f"취소 메트릭 업데이트 실패: {metric_error}")
 
     def _finalize_result(self, state: dict, config=None) -> dict:
         """최종 결과 정리 및 포맷팅"""
@@ -148,8 +343,35 @@ class YouTubeReporterWorkflow:
 
         return {**state, "final_output": final_output}
 
-    def process(self, youtube_url: str, job_id: str = None, user_id: str = None) -> dict:
-        """YouTube URL을 처리하여 리포트 생성"""
+    def _record_timings(self, final_output: dict, node_timings: Dict[str, float], wall_clock: float):
+        """노드별 실행 시간과 병렬 실행으로 절약된 시간을 기록"""
+        sequential = sum(node_timings.values())
+        saved = max(0.0, sequential - wall_clock)
+
+        logger.info(f"⏱️ 전체 {wall_clock:.2f}초 (순차 실행 시 {sequential:.2f}초, 병렬 실행으로 {saved:.2f}초 절약)")
+
+        try:
+            from app.monitoring.services.metrics import workflow_parallel_saved_seconds
+            workflow_parallel_saved_seconds.observe(saved)
+        except Exception as e:
+            logger.warning(f"워크플로우 메트릭 업데이트 실패: {e}")
+
+        if final_output:
+            final_output.setdefault("process_info", {})["timings"] = {
+                "nodes": node_timings,
+                "wall_clock": round(wall_clock, 3),
+                "sequential": round(sequential, 3),
+                "saved": round(saved, 3)
+            }
+
+    def process(self, youtube_url: str, job_id: str = None, user_id: str = None, resume: bool = False) -> dict:
+        """
+        YouTube URL을 처리하여 리포트 생성
+
+        Args:
+            resume: 체크포인트가 있으면 마지막으로 완료된 노드 이후부터 이어서 실행
+                    (이어서 실행할 지점이 없으면 처음부터 실행)
+        """
         logger.info(f"\n{'=' * 60}")
         logger.info(f"🎬 YouTube Reporter 시작: {youtube_url}")
         logger.info(f"🆔 Job ID: {job_id}")
@@ -163,11 +385,14 @@ class YouTubeReporterWorkflow:
             "caption": "",
             "summary": "",
             "visualization_requests": [],
+            "node_timings": {},
             "visual_sections": [],
             "report_result": {},
             "final_output": {}
         }
 
+        succeeded = False
+        cancelled = False
         try:
             # 진행률 초기화
             if job_id:
@@ -176,18 +401,49 @@ class YouTubeReporterWorkflow:
                 except Exception as e:
                     logger.warning(f"진행률 초기화 실패 (무시됨): {e}")
 
-            logger.info("📝 1단계: 자막 추출 시작...")
-            result = self.graph.invoke(initial_state)
+            resume_config = self.get_resume_config(job_id) if resume else None
+
+            start_time = time.monotonic()
+            if resume_config:
+                logger.info(f"🔁 체크포인트에서 이어서 실행: {job_id}")
+                result = self.graph.invoke(None, resume_config)
+            else:
+                logger.info("📝 1단계: 자막 추출 시작...")
+                result = self.graph.invoke(initial_state, self._thread_config(job_id))
+            wall_clock = time.monotonic() - start_time
 
             final_output = result.get("final_output", {})
+            if resume_config:
+                # 이전 실행의 노드 시간이 섞여 있으므로 병렬 절약 시간은 기록하지 않음
+                final_output.setdefault("process_info", {})["resumed"] = True
+            else:
+                self._record_timings(final_output, result.get("node_timings", {}), wall_clock)
 
             if final_output.get("success"):
+                succeeded = True
                 logger.info("\n✅ 리포트 생성 성공!")
             else:
                 logger.warning("\n⚠️ 리포트 생성 중 일부 문제 발생")
 
             return final_output
 
+        except JobCancelledError as e:
+            cancelled = True
+            self._record_cancellation(e)
+            return {
+                "success": False,
+                "cancelled": True,
+                "title": "분석 취소됨",
+                "summary": "사용자 요청으로 분석이 취소되었습니다.",
+                "sections": [],
+                "process_info": {
+                    "youtube_url": youtube_url,
+                    "user_id": user_id,
+                    "job_id": job_id,
+                    "llm_calls_saved": e.llm_calls_saved
+                }
+            }
+
         except Exception as e:
             logger.error(f"\n❌ 워크플로우 실행 실패: {str(e)}")
 
@@ -214,4 +470,10 @@ class YouTubeReporterWorkflow:
                     "job_id": job_id,
                     "error": str(e)
                 }
-            }
\ No newline at end of file
+            }
+
+        finally:
+            # 성공/취소한 작업과, 체크포인트를 보관하지 않는 설정(memory)의 실패 작업은 체크포인트 삭제
+            # (MemorySaver에 실패 작업의 단계별 상태가 프로세스 수명 동안 쌓이지 않도록)
+            if succeeded or cancelled or not self.keep_failed_checkpoints:
+                self._clear_checkpoints(job_id)
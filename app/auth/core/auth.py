@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.auth.services.cognito_service import verify_access_token
@@ -8,7 +9,8 @@ security = HTTPBearer()
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict:
     try:
         token = credentials.credentials
-        result = verify_access_token(token)
+        # JWKS 갱신/Cognito 호출이 이벤트 루프를 막지 않도록 스레드에서 검증
+        result = await asyncio.to_thread(verify_access_token, token)
         if not result["valid"]:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -13,6 +13,15 @@ class Settings(BaseSettings):
     COGNITO_CLIENT_ID: Optional[str] = None
     COGNITO_CLIENT_SECRET: Optional[str] = None
     AWS_REGION: str = "us-west-2"
+
+    # Access Token 검증 방식
+    # local: JWKS로 서명/만료/발급자/client_id 로컬 검증
+    # strict: local 검증 후 Cognito get_user로 폐기 여부까지 확인
+    # remote: 매 요청 Cognito get_user 호출 (기존 방식)
+    COGNITO_TOKEN_VERIFICATION: str = "local"  # local | strict | remote
+    COGNITO_JWKS_REFRESH_SECONDS: int = 3600
+    COGNITO_JWKS_MIN_REFRESH_SECONDS: int = 60
+    COGNITO_TOKEN_CACHE_MAX_ENTRIES: int = 10000
     
     model_config = ConfigDict(
         env_file=".env",
@@ -2,8 +2,12 @@ import boto3
 import hmac
 import hashlib
 import base64
+import logging
 from botocore.exceptions import ClientError
 from app.auth.core.config import settings
+from app.auth.services.token_verifier import token_verifier, TokenVerificationError, JWKSUnavailableError
+
+logger = logging.getLogger(__name__)
 
 client = boto3.client("cognito-idp", region_name=settings.AWS_REGION)
 
@@ -98,8 +102,28 @@ def get_user_info(access_token: str):
         raise e
 
 def verify_access_token(access_token: str):
+    mode = (settings.COGNITO_TOKEN_VERIFICATION or "local").lower()
+    if mode == "remote":
+        return _verify_access_token_remote(access_token)
+
+    try:
+        claims = token_verifier.verify(access_token)
+    except TokenVerificationError as e:
+        return {"valid": False, "error": str(e)}
+    except JWKSUnavailableError as e:
+        # JWKS를 가져올 수 없으면 Cognito 호출로 대체
+        logger.warning(f"로컬 토큰 검증 불가, Cognito로 확인합니다: {e}")
+        return _verify_access_token_remote(access_token)
+
+    if mode == "strict":
+        # 로그아웃/폐기된 토큰까지 확인
+        return _verify_access_token_remote(access_token)
+
+    return {"valid": True, "username": claims["username"]}
+
+def _verify_access_token_remote(access_token: str):
     try:
         response = client.get_user(AccessToken=access_token)
         return {"valid": True, "username": response['Username']}
     except ClientError as e:
-        return {"valid": False, "error": e.response["Error"]["Message"]} 
\ No newline at end of file
+        return {"valid": False, "error": e.response["Error"]["Message"]}
@@ -0,0 +1,121 @@
+import time
+import hashlib
+import threading
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+from jose import jwt
+
+from app.auth.core.config import settings
+from app.core.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenVerificationError(Exception):
+    """토큰이 유효하지 않음 (서명/만료/발급자/클라이언트 불일치 등)"""
+
+
+class JWKSUnavailableError(Exception):
+    """User Pool JWKS를 가져올 수 없음 (로컬 검증 불가)"""
+
+
+class CognitoTokenVerifier:
+    """
+    Cognito Access Token 로컬 검증기
+
+    - User Pool JWKS를 캐시하고 COGNITO_JWKS_REFRESH_SECONDS마다 갱신
+      (알 수 없는 kid가 오면 키 교체로 보고 최소 간격을 두고 즉시 갱신)
+    - 갱신 실패도 최소 간격 동안 기억하여 JWKS 장애 중에는 기존 키 또는 Cognito 호출로 대체
+    - 검증된 토큰은 SHA-256 해시를 키로 exp까지 LRU에 보관하여 재검증 생략
+    """
+
+    def __init__(self):
+        self.issuer = f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.COGNITO_USER_POOL_ID}"
+        self.jwks_url = f"{self.issuer}/.well-known/jwks.json"
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._keys_fetched_at = 0.0
+        self._last_attempt_at = float("-inf")
+        self._lock = threading.Lock()
+        self._verified = LRUCache(max_entries=settings.COGNITO_TOKEN_CACHE_MAX_ENTRIES)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """토큰을 검증하고 claims 반환 (유효하지 않으면 TokenVerificationError)"""
+        cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        claims = self._verified.get(cache_key)
+        if claims is not None:
+            return claims
+
+        try:
+            header = jwt.get_unverified_header(token)
+        except Exception as e:
+            raise TokenVerificationError(f"토큰 헤더를 읽을 수 없습니다: {e}")
+
+        key = self._get_key(header.get("kid"))
+        if key is None:
+            raise TokenVerificationError("알 수 없는 서명 키(kid)입니다")
+
+        try:
+            # Access Token에는 aud가 없으므로 client_id를 직접 확인
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                issuer=self.issuer,
+                options={"verify_aud": False}
+            )
+        except Exception as e:
+            raise TokenVerificationError(str(e))
+
+        if claims.get("token_use") != "access":
+            raise TokenVerificationError("Access Token이 아닙니다")
+        if settings.COGNITO_CLIENT_ID and claims.get("client_id") != settings.COGNITO_CLIENT_ID:
+            raise TokenVerificationError("다른 앱 클라이언트에 발급된 토큰입니다")
+
+        ttl = claims.get("exp", 0) - time.time()
+        if ttl > 0:
+            self._verified.set(cache_key, claims, ttl=ttl)
+        return claims
+
+    def _get_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            expired = now - self._keys_fetched_at > settings.COGNITO_JWKS_REFRESH_SECONDS
+            # 키 교체 직후를 위해 모르는 kid는 갱신
+            unknown_kid = kid not in self._keys
+            # 실패 포함 모든 갱신 시도는 최소 간격을 두어 JWKS 장애 시 요청마다 재시도하지 않음
+            should_refresh = (expired or unknown_kid) and \
+                now - self._last_attempt_at > settings.COGNITO_JWKS_MIN_REFRESH_SECONDS
+            if should_refresh:
+                self._last_attempt_at = now
+            keys = self._keys
+
+        if should_refresh:
+            # HTTP 호출은 락 밖에서 (다른 요청은 그동안 기존 키로 검증)
+            keys = self._refresh_keys(now) or keys
+
+        if not keys:
+            raise JWKSUnavailableError("JWKS를 아직 가져오지 못했습니다")
+        return keys.get(kid)
+
+    def _refresh_keys(self, now: float) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            response = requests.get(self.jwks_url, timeout=5)
+            response.raise_for_status()
+            keys = {key["kid"]: key for key in response.json().get("keys", [])}
+        except Exception as e:
+            if not self._keys:
+                raise JWKSUnavailableError(f"JWKS 조회 실패: {e}")
+            # 기존 키로 계속 검증
+            logger.warning(f"JWKS 갱신 실패 (기존 키 사용): {e}")
+            return None
+
+        with self._lock:
+            self._keys = keys
+            self._keys_fetched_at = now
+        logger.info(f"🔑 Cognito JWKS 갱신: {len(keys)}개 키")
+        return keys
+
+
+token_verifier = CognitoTokenVerifier()
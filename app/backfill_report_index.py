@@ -0,0 +1,71 @@
+# app/backfill_report_index.py
+"""
+보고서 목록 인덱스 백필
+
+user_reports 인덱스 컬럼(youtube_url, 채널, 썸네일 등)이 추가되기 전에 만들어진
+보고서 행을 S3 리포트의 metadata로 채웁니다. 여러 번 실행해도 안전합니다.
+
+    python -m app.backfill_report_index [--batch-size 100] [--dry-run]
+"""
+import argparse
+import logging
+
+from app.database.core.database import SessionLocal
+from app.database.models.database_models import UserReport
+from app.database.services.database_service import database_service
+from app.s3.services.user_s3_service import user_s3_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill(batch_size: int = 100, dry_run: bool = False) -> int:
+    """인덱스 컬럼이 비어 있는 JSON 보고서 행을 채우고 갱신한 행 수를 반환"""
+    updated = 0
+    last_id = ""
+
+    db = SessionLocal()
+    try:
+        while True:
+            # id 기준 키셋 순회 (메타데이터가 없는 리포트도 한 번씩만 확인)
+            rows = db.query(UserReport).filter(
+                UserReport.id > last_id,
+                UserReport.file_type == "json",
+                UserReport.youtube_url.is_(None)
+            ).order_by(UserReport.id).limit(batch_size).all()
+            if not rows:
+                break
+
+            for row in rows:
+                last_id = row.id
+                report_data = user_s3_service.get_report_json(row.s3_key) if row.s3_key else None
+                metadata = (report_data or {}).get("metadata")
+                if not metadata:
+                    logger.warning(f"리포트 metadata 없음 (건너뜀): {row.s3_key}")
+                    continue
+
+                if dry_run:
+                    logger.info(f"[dry-run] 인덱스 갱신 대상: {row.job_id} - {metadata.get('youtube_title', '')}")
+                else:
+                    database_service.update_report_index(db, row, metadata)
+                updated += 1
+
+            logger.info(f"📇 {updated}개 보고서 인덱스 처리 (마지막 id: {last_id})")
+    finally:
+        db.close()
+
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="user_reports 목록 인덱스 백필")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--dry-run", action="store_true", help="DB를 수정하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    updated = backfill(batch_size=args.batch_size, dry_run=args.dry_run)
+    logger.info(f"✅ 보고서 인덱스 백필 완료: {updated}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,18 @@
 # chains/qa_chain.py
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_aws import ChatBedrock
-import boto3
 import sys
 import os
+from functools import lru_cache
 
 # 상위 디렉토리의 app.core.config를 사용하기 위한 경로 설정
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from app.core.config import settings
+from app.core.bedrock_registry import get_chat_model
 
+@lru_cache()
 def build_qa_chain():
-    """QA 체인 빌드"""
-    llm = ChatBedrock(
-        client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-        model_id=settings.BEDROCK_MODEL_ID,
-        model_kwargs={"temperature": 0.0, "max_tokens": 4096}
-    )
+    """QA 체인 빌드 (체인은 상태가 없으므로 한 번만 만들어 재사용)"""
+    llm = get_chat_model("chatbot_qa", 0.0, 4096)
     
     prompt = ChatPromptTemplate.from_messages([
         ("system", "You are a helpful assistant. Answer the question based on the provided context."),
@@ -1,24 +1,21 @@
 # retrievers/kb_retriever.py
-import boto3
 import sys
 import os
-from langchain_aws import ChatBedrock
+from functools import lru_cache
 
 # 상위 디렉토리의 app.core.config를 사용하기 위한 경로 설정
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from app.core.config import settings
+from app.core.bedrock_registry import get_bedrock_client, get_chat_model
 
 def get_llm():
-    """Bedrock LLM 클라이언트 반환"""
-    return ChatBedrock(
-        client=boto3.client("bedrock-runtime", region_name=settings.AWS_REGION),
-        model_id=settings.BEDROCK_MODEL_ID,
-        model_kwargs={"temperature": 0.0, "max_tokens": 4096}
-    )
+    """Bedrock LLM 클라이언트 반환 (프로세스 전역 공유 인스턴스)"""
+    return get_chat_model("chatbot", 0.0, 4096)
 
+@lru_cache()
 def get_kb_retriever():
-    """Bedrock Knowledge Base 검색기 반환"""
-    bedrock_client = boto3.client("bedrock-agent-runtime", region_name=settings.AWS_REGION)
+    """Bedrock Knowledge Base 검색기 반환 (공유 클라이언트 사용)"""
+    bedrock_client = get_bedrock_client("bedrock-agent-runtime")
     
     def retrieve(query: str):
         try:
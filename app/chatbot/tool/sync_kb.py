@@ -1,6 +1,5 @@
 # tools/sync_kb.py
 
-import boto3
 import json
 import sys
 import os
@@ -9,11 +8,12 @@ from botocore.exceptions import ClientError
 # 상위 디렉토리의 app.core.config를 사용하기 위한 경로 설정
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from app.core.config import settings
+from app.core.bedrock_registry import get_bedrock_client
 
 def sync_kb():
     """Bedrock Knowledge Base 동기화 Job 시작"""
     try:
-        bedrock_client = boto3.client("bedrock-agent", region_name=settings.AWS_REGION)
+        bedrock_client = get_bedrock_client("bedrock-agent")
         
         # 진행 중인 job 확인
         try:
@@ -74,7 +74,7 @@ def sync_kb():
         return None
 
     print("✅ 환경 변수 검증 통과")
-    kb_client = boto3.client("bedrock-agent", region_name=settings.AWS_REGION)
+    kb_client = get_bedrock_client("bedrock-agent")
     print("✅ Bedrock Agent 클라이언트 생성 완료")
 
     # ① 진행 중인 Job 확인
@@ -1,5 +1,4 @@
 #tool/wait_until_kb_sync_complete.py
-import boto3
 import time
 import sys
 import os
@@ -7,11 +6,12 @@ import os
 # 상위 디렉토리의 app.core.config를 사용하기 위한 경로 설정
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from app.core.config import settings
+from app.core.bedrock_registry import get_bedrock_client
 
 def get_ingestion_job_status(job_id: str) -> str:
     """KB 동기화 Job 상태 조회"""
     try:
-        bedrock_client = boto3.client("bedrock-agent", region_name=settings.AWS_REGION)
+        bedrock_client = get_bedrock_client("bedrock-agent")
         response = bedrock_client.get_ingestion_job(
             knowledgeBaseId=settings.BEDROCK_KB_ID,
             dataSourceId=settings.BEDROCK_DS_ID,
@@ -0,0 +1,76 @@
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+import boto3
+from botocore.config import Config
+from langchain_aws import ChatBedrock
+
+from app.core.config import settings
+from app.core.llm_cache import get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_clients: Dict[str, object] = {}
+_chat_models: Dict[Tuple[str, str, float, int], ChatBedrock] = {}
+
+
+def _client_config() -> Config:
+    return Config(
+        region_name=settings.AWS_REGION,
+        max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=settings.BEDROCK_CONNECT_TIMEOUT,
+        read_timeout=settings.BEDROCK_READ_TIMEOUT,
+        retries={"max_attempts": settings.BEDROCK_MAX_RETRIES, "mode": "adaptive"}
+    )
+
+
+def get_bedrock_client(service_name: str = "bedrock-runtime"):
+    """
+    프로세스 전역 Bedrock 클라이언트 반환
+
+    boto3 클라이언트는 생성 후에는 스레드 안전하므로 서비스별로 하나만 만들어
+    커넥션 풀(keep-alive)을 모든 에이전트/요청이 공유합니다.
+    """
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(service_name)
+        if client is None:
+            # 기본 세션은 스레드 안전하지 않으므로 생성은 잠금 안에서 수행
+            client = boto3.session.Session().client(service_name, config=_client_config())
+            _clients[service_name] = client
+            logger.info(f"🔌 Bedrock 클라이언트 생성: {service_name}")
+        return client
+
+
+def get_chat_model(agent: str, temperature: float, max_tokens: int,
+                   model_id: Optional[str] = None) -> ChatBedrock:
+    """
+    에이전트별 공유 ChatBedrock 인스턴스 반환
+
+    (에이전트, 모델 ID, temperature, max_tokens)마다 하나의 인스턴스를 재사용하며,
+    LLM 응답 캐시(get_llm_cache)도 함께 연결합니다.
+    """
+    model_id = model_id or settings.BEDROCK_MODEL_ID
+    key = (agent, model_id, temperature, max_tokens)
+
+    llm = _chat_models.get(key)
+    if llm is not None:
+        return llm
+
+    client = get_bedrock_client("bedrock-runtime")
+    with _lock:
+        llm = _chat_models.get(key)
+        if llm is None:
+            llm = ChatBedrock(
+                client=client,
+                model_id=model_id,
+                model_kwargs={"temperature": temperature, "max_tokens": max_tokens},
+                cache=get_llm_cache(agent, model_id, temperature, max_tokens)
+            )
+            _chat_models[key] = llm
+        return llm
@@ -17,6 +17,12 @@ class Settings(BaseSettings):
     AWS_REGION: str = "us-west-2"
     AWS_S3_BUCKET: Optional[str] = None
     S3_PREFIX: Optional[str] = None
+    # 파일 목록 조회 시 head_object 동시 실행 수 (S3 클라이언트 커넥션 풀 10개 이하로 유지)
+    S3_METADATA_MAX_CONCURRENCY: int = 8
+    # 사전 서명 URL 캐시 (프로세스별로 만료 임박 전까지 같은 URL 재사용)
+    PRESIGNED_URL_EXPIRES_SECONDS: int = 3600
+    PRESIGNED_URL_REFRESH_MARGIN_SECONDS: int = 600
+    PRESIGNED_URL_CACHE_MAX_ENTRIES: int = 10000
 
     # Bedrock 설정 (bedrock_chatbot에서 통합)
     BEDROCK_KB_ID: Optional[str] = None
@@ -26,6 +32,80 @@ class Settings(BaseSettings):
     BEDROCK_MAX_TOKENS: int = 4000
     YOUTUBE_LAMBDA_NAME: Optional[str] = None
 
+    # Bedrock 클라이언트 설정 (프로세스 전역 공유 클라이언트)
+    BEDROCK_MAX_POOL_CONNECTIONS: int = 50
+    BEDROCK_MAX_RETRIES: int = 5  # adaptive 재시도 모드
+    BEDROCK_CONNECT_TIMEOUT: int = 5
+    BEDROCK_READ_TIMEOUT: int = 300
+
+    # LLM 응답 캐시 설정 (모델 ID + temperature + max_tokens + 프롬프트 해시 기준)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "memory"  # redis | memory
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_MAX_ENTRIES: int = 512
+    LLM_CACHE_AGENTS: List[str] = [
+        "summary_agent", "report_agent", "visualization_analyzer", "visualization_generator"
+    ]
+
+    # 요약 설정 (임계값보다 긴 자막은 구간별 map-reduce 요약)
+    SUMMARY_MAP_REDUCE_ENABLED: bool = True
+    SUMMARY_MAP_REDUCE_THRESHOLD: int = 6000  # 자막 길이(자)
+    SUMMARY_CHUNK_TOKENS: int = 3000
+    SUMMARY_CHUNK_OVERLAP_TOKENS: int = 150
+    SUMMARY_MAP_CONCURRENCY: int = 4
+    # 구간 요약을 합친 길이가 이 값을 넘으면 묶음별로 먼저 합친 뒤 통합 (계층적 reduce)
+    SUMMARY_REDUCE_MAX_TOKENS: int = 12000
+
+    # 요약 스트리밍 설정 (생성 중인 요약을 작업별 채널로 전달)
+    SUMMARY_STREAMING_ENABLED: bool = True
+    SUMMARY_STREAM_BACKEND: str = "memory"  # redis | memory
+    SUMMARY_STREAM_TTL_SECONDS: int = 3600
+    SUMMARY_STREAM_IDLE_TIMEOUT: int = 300
+
+    # 분석 작업 실행기 설정 (프로세스 전역 워커 수 + 대기열 한도)
+    ANALYSIS_MAX_WORKERS: int = 4
+    ANALYSIS_QUEUE_MAX_SIZE: int = 20
+    ANALYSIS_QUEUE_RETRY_AFTER_SECONDS: int = 30
+
+    # 작업 진행률 저장소 설정 (여러 Pod에서 조회하려면 redis)
+    PROGRESS_BACKEND: str = "memory"  # redis | memory
+    PROGRESS_TTL_SECONDS: int = 6 * 3600
+    PROGRESS_MAX_ENTRIES: int = 10000
+    PROGRESS_STREAM_MAX_SECONDS: int = 1800  # 진행률 SSE 연결 최대 유지 시간
+
+    # 작업 대기열 설정
+    # local: API 프로세스의 job_executor에서 실행
+    # database: user_analysis_jobs 테이블에 남겨두고 별도 워커(python -m app.worker)가 가져가 실행
+    JOB_QUEUE_BACKEND: str = "local"  # local | database
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_HEARTBEAT_INTERVAL_SECONDS: int = 30
+    JOB_LEASE_TIMEOUT_SECONDS: int = 120  # 하트비트가 이보다 오래 끊기면 다른 워커가 다시 가져감
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_CLAIM_MAX_AGE_HOURS: int = 24
+
+    # 워크플로우 체크포인트 설정 (실패/중단된 작업을 마지막으로 완료된 노드 이후부터 재개)
+    # redis: RedisJSON/RediSearch 모듈이 있는 Redis Stack 필요, 실패한 작업의 체크포인트를 TTL 동안 보관
+    # memory: 실행 중에만 유지하고 종료(성공/실패/취소) 시 삭제 (개발용, 다른 워커/재시작 후 재개 불가)
+    WORKFLOW_CHECKPOINTER: str = "none"  # redis | memory | none
+    WORKFLOW_CHECKPOINT_TTL_MINUTES: int = 24 * 60
+
+    # 시각화 생성 설정 (1 이하이면 순차 실행)
+    VISUALIZATION_MAX_CONCURRENCY: int = 4
+    VISUALIZATION_ITEM_TIMEOUT: float = 90.0
+
+    # 분석 결과 재사용 설정 (같은 영상 + 같은 파이프라인 버전의 완료된 리포트)
+    ANALYSIS_PIPELINE_VERSION: str = "1"
+    REPORT_REUSE_ENABLED: bool = True
+    REPORT_REUSE_MAX_AGE_HOURS: int = 24
+
+    # 리포트 저장 포맷 (json: 기존 들여쓰기 JSON, zstd: orjson + zstandard 압축)
+    # 읽기는 두 포맷 모두 지원하므로 전환 시 기존 객체를 변환할 필요 없음
+    REPORT_STORAGE_FORMAT: str = "json"
+    REPORT_ZSTD_LEVEL: int = 6
+
+    # 파싱된 리포트 캐시 (S3 키 + ETag 기준)
+    REPORT_CACHE_MAX_ENTRIES: int = 128
+
     # Polly 설정
     POLLY_VOICE_ID: str = "Seoyeon"
 
@@ -35,6 +115,13 @@ class Settings(BaseSettings):
     # API 키
     VIDCAP_API_KEY: str = ""
 
+    # 자막 캐시 설정 (비디오 ID + 언어 기준, 인메모리 LRU + 공유 저장소)
+    CAPTION_CACHE_ENABLED: bool = True
+    CAPTION_CACHE_MAX_ENTRIES: int = 256
+    CAPTION_CACHE_BACKEND: str = "s3"  # s3 | disk | none
+    CAPTION_CACHE_S3_PREFIX: str = "captions/_cache/"
+    CAPTION_CACHE_DIR: str = "/tmp/caption_cache"
+
     # YouTube API 설정
     YOUTUBE_API_KEY: Optional[str] = None
 
@@ -56,6 +143,17 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "password"
     DB_NAME: str = "backend_final"
     DATABASE_URL: Optional[str] = None
+    # 커넥션 풀 설정 (동기/비동기 엔진 각각에 적용, Pod당 최대 연결 = 2 * (POOL_SIZE + MAX_OVERFLOW))
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 300
+    DB_POOL_PRE_PING: bool = True
+    # 비동기 엔진 URL (비워두면 database_url의 드라이버를 비동기 드라이버로 바꿔 사용)
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Redis 설정
+    REDIS_URL: str = "redis://localhost:6379/0"
 
     @property
     def database_url(self) -> str:
@@ -64,6 +162,18 @@ class Settings(BaseSettings):
             return self.DATABASE_URL
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def async_database_url(self) -> str:
+        """비동기 엔진용 URL (pymysql -> aiomysql, sqlite -> aiosqlite)"""
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        url = self.database_url
+        if url.startswith("mysql+pymysql://") or url.startswith("mysql://"):
+            return "mysql+aiomysql://" + url.split("://", 1)[1]
+        if url.startswith("sqlite://"):
+            return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+        return url
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
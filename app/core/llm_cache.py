@@ -0,0 +1,214 @@
+import json
+import hashlib
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 강제 새로고침/재시도 중에는 캐시를 조회하지 않음 (저장은 그대로 해서 항목을 새 응답으로 교체)
+_bypass_lookup: ContextVar[bool] = ContextVar("llm_cache_bypass_lookup", default=False)
+
+
+class MemoryLLMCacheStore:
+    """프로세스 내 LRU 저장소 (Redis를 쓸 수 없는 로컬/테스트 환경용)"""
+
+    def __init__(self):
+        self._cache = LRUCache(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str, ttl: int):
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str):
+        self._cache.pop(key)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class RedisLLMCacheStore:
+    """Redis 저장소 (여러 Pod/워커가 같은 캐시를 공유)"""
+
+    prefix = "llm_cache:"
+
+    def get(self, key: str) -> Optional[str]:
+        from app.core.redis_client import get_redis_client
+        return get_redis_client().get(f"{self.prefix}{key}")
+
+    def set(self, key: str, value: str, ttl: int):
+        from app.core.redis_client import get_redis_client
+        get_redis_client().set(f"{self.prefix}{key}", value, ex=ttl)
+
+    def delete(self, key: str):
+        from app.core.redis_client import get_redis_client
+        get_redis_client().delete(f"{self.prefix}{key}")
+
+    def clear(self):
+        from app.core.redis_client import get_redis_client
+        client = get_redis_client()
+        for key in client.scan_iter(match=f"{self.prefix}*", count=500):
+            client.delete(key)
+
+
+class LLMResponseCache(BaseCache):
+    """
+    ChatBedrock 인스턴스별 응답 캐시
+
+    키: 모델 ID + temperature + max_tokens + (LLM 설정 문자열 + 렌더링된 프롬프트)의 SHA-256
+    저장소 오류는 캐시 미스로 처리하여 LLM 호출을 막지 않습니다.
+    bypass_llm_cache() 안에서는 조회를 건너뛰고, 파싱에 실패한 응답은 evict_chat()으로 지웁니다.
+    """
+
+    def __init__(self, agent: str, model_id: str, temperature: float, max_tokens: int, store):
+        self.agent = agent
+        self.model_id = model_id
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.store = store
+
+    def _key(self, prompt: str, llm_string: str) -> str:
+        digest = hashlib.sha256(f"{llm_string}\n{prompt}".encode("utf-8")).hexdigest()
+        return f"{self.model_id}:{self.temperature}:{self.max_tokens}:{digest}"
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        if _bypass_lookup.get():
+            self._record("bypass")
+            return None
+
+        try:
+            raw = self.store.get(self._key(prompt, llm_string))
+        except Exception as e:
+            logger.warning(f"LLM 캐시 조회 실패 (무시됨): {e}")
+            raw = None
+
+        if raw is None:
+            self._record("miss")
+            return None
+
+        try:
+            generations = [loads(item) for item in json.loads(raw)]
+        except Exception as e:
+            logger.warning(f"LLM 캐시 역직렬화 실패 (무시됨): {e}")
+            self._record("miss")
+            return None
+
+        self._record("hit")
+        logger.info(f"⚡ LLM 캐시 적중: {self.agent}")
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        try:
+            value = json.dumps([dumps(generation) for generation in return_val])
+            self.store.set(self._key(prompt, llm_string), value, settings.LLM_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"LLM 캐시 저장 실패 (무시됨): {e}")
+
+    def evict(self, prompt: str, llm_string: str) -> None:
+        try:
+            self.store.delete(self._key(prompt, llm_string))
+        except Exception as e:
+            logger.warning(f"LLM 캐시 삭제 실패 (무시됨): {e}")
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+    def _record(self, result: str):
+        try:
+            from app.monitoring.services.metrics import llm_cache_requests_total
+            llm_cache_requests_total.labels(agent=self.agent, result=result).inc()
+        except Exception as e:
+            logger.warning(f"LLM 캐시 메트릭 업데이트 실패: {e}")
+
+
+@lru_cache()
+def _get_store():
+    if (settings.LLM_CACHE_BACKEND or "").lower() == "redis":
+        return RedisLLMCacheStore()
+    return MemoryLLMCacheStore()
+
+
+def get_llm_cache(agent: str, model_id: str, temperature: float, max_tokens: int) -> Optional[LLMResponseCache]:
+    """
+    에이전트별 LLM 캐시 반환
+
+    LLM_CACHE_AGENTS에 포함된 에이전트만 캐시를 사용하며, 그 외에는 None(캐시 없음)을 반환합니다.
+    """
+    if not settings.LLM_CACHE_ENABLED or agent not in settings.LLM_CACHE_AGENTS:
+        return None
+    return LLMResponseCache(agent, model_id, temperature, max_tokens, _get_store())
+
+
+@contextmanager
+def bypass_llm_cache(enabled: bool = True):
+    """블록 안의 LLM 호출은 캐시를 조회하지 않고 새로 생성 (force_refresh/재시도용)"""
+    token = _bypass_lookup.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass_lookup.reset(token)
+
+
+def _chat_prompt(llm, llm_input) -> str:
+    """llm.invoke와 같은 방식으로 입력(문자열/메시지 목록)을 캐시 프롬프트 문자열로 변환"""
+    return dumps(llm._convert_input(llm_input).to_messages())
+
+
+def lookup_chat_text(llm, messages) -> Optional[str]:
+    """
+    채팅 모델 캐시에서 응답 텍스트 조회 (llm.stream처럼 캐시를 거치지 않는 호출용)
+
+    키는 llm.invoke와 같은 방식(LLM 설정 문자열 + 직렬화된 메시지)으로 만들어 invoke/stream이
+    같은 항목을 공유합니다. 캐시가 없거나 미스면 None을 반환합니다.
+    """
+    cache = getattr(llm, "cache", None)
+    if not isinstance(cache, LLMResponseCache):
+        return None
+    try:
+        generations = cache.lookup(_chat_prompt(llm, messages), llm._get_llm_string())
+    except Exception as e:
+        logger.warning(f"LLM 캐시 조회 실패 (무시됨): {e}")
+        return None
+    if not generations:
+        return None
+    return generations[0].text
+
+
+def update_chat_text(llm, messages, text: str) -> None:
+    """스트리밍으로 조립한 응답 텍스트를 lookup_chat_text와 같은 키로 저장"""
+    cache = getattr(llm, "cache", None)
+    if not isinstance(cache, LLMResponseCache) or not text:
+        return
+    try:
+        cache.update(_chat_prompt(llm, messages), llm._get_llm_string(),
+                     [ChatGeneration(message=AIMessage(content=text))])
+    except Exception as e:
+        logger.warning(f"LLM 캐시 저장 실패 (무시됨): {e}")
+
+
+def evict_chat(llm, llm_input) -> None:
+    """
+    llm.invoke(llm_input) 결과로 저장된 캐시 항목 삭제
+
+    파싱/검증에 실패한 응답이 캐시에 남아 재시도 때마다 같은 응답이 재생되지 않도록 합니다.
+    """
+    cache = getattr(llm, "cache", None)
+    if not isinstance(cache, LLMResponseCache):
+        return
+    try:
+        cache.evict(_chat_prompt(llm, llm_input), llm._get_llm_string())
+    except Exception as e:
+        logger.warning(f"LLM 캐시 삭제 실패 (무시됨): {e}")
+    else:
+        logger.info(f"🧹 파싱 실패 응답을 LLM 캐시에서 삭제: {cache.agent}")
@@ -0,0 +1,27 @@
+import redis
+import redis.asyncio as redis_asyncio
+from functools import lru_cache
+from app.core.config import settings
+
+
+@lru_cache()
+def get_redis_client() -> redis.Redis:
+    """프로세스 전역 Redis 클라이언트 (내부 커넥션 풀 공유)"""
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=1,
+        socket_timeout=2,
+        health_check_interval=30
+    )
+
+
+@lru_cache()
+def get_async_redis_client() -> redis_asyncio.Redis:
+    """API 이벤트 루프용 asyncio Redis 클라이언트 (Pub/Sub 구독 등)"""
+    return redis_asyncio.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=1,
+        health_check_interval=30
+    )
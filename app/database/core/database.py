@@ -1,17 +1,46 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.database.core.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool, instrument_engine
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    """배포 환경별 풀 설정 (Settings의 DB_POOL_*), SQLite는 기본 풀 사용"""
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if not url.startswith("sqlite"):
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
 
 # MySQL 연결을 위한 추가 설정
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False
+    echo=False,
+    **_pool_options(settings.database_url, InstrumentedQueuePool)
 )
+instrument_engine(engine, "sync")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 엔드포인트용 비동기 엔진 (이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=False,
+    **_pool_options(settings.async_database_url, InstrumentedAsyncQueuePool)
+)
+instrument_engine(async_engine.sync_engine, "async")
+# 커밋 후에도 응답 구성에 객체 속성을 쓰므로 만료시키지 않음
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -19,4 +48,8 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
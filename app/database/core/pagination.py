@@ -0,0 +1,55 @@
+"""
+키셋(커서) 페이지네이션
+
+(created_at, id) 내림차순 목록에서 마지막 항목의 (created_at, id)를 불투명한 커서 문자열로
+전달합니다. OFFSET과 달리 (user_id, created_at) 인덱스를 그대로 따라가므로 깊은 페이지도
+일정한 비용으로 조회됩니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except Exception:
+        raise InvalidCursorError(f"잘못된 페이지 커서입니다: {cursor}")
+
+
+def keyset_filter(model, cursor: Optional[str]):
+    """커서 이후(더 오래된) 행만 남기는 조건 (커서가 없으면 None)"""
+    if not cursor:
+        return None
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id)
+    )
+
+
+def keyset_order(model) -> tuple:
+    return model.created_at.desc(), model.id.desc()
+
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """limit + 1개 조회 결과를 (현재 페이지, 다음 커서)로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
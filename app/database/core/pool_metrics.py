@@ -0,0 +1,72 @@
+"""
+SQLAlchemy 커넥션 풀 메트릭
+
+풀 이벤트(checkout/checkin/invalidate)로 사용 중/오버플로 커넥션 수를 갱신하고,
+풀에서 커넥션을 얻기까지 기다린 시간을 db_pool_checkout_wait_seconds로 기록합니다.
+지연이 MySQL 쿼리 때문인지 풀 대기 때문인지 구분하는 용도입니다.
+"""
+import time
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedCheckoutMixin:
+    """풀에서 커넥션을 꺼내는 데 걸린 시간(대기 + 새 연결 생성) 측정"""
+
+    metrics_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            try:
+                from app.monitoring.services.metrics import db_pool_checkout_wait_seconds
+                db_pool_checkout_wait_seconds.labels(engine=self.metrics_name).observe(time.perf_counter() - start)
+            except Exception as e:
+                logger.debug(f"DB 풀 대기 메트릭 업데이트 실패: {e}")
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """동기 엔진용 QueuePool"""
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 AsyncAdaptedQueuePool"""
+
+
+def instrument_engine(engine, name: str):
+    """엔진 풀에 메트릭 이벤트 등록 (create_async_engine은 engine.sync_engine을 전달)"""
+    pool = engine.pool
+    if isinstance(pool, _TimedCheckoutMixin):
+        pool.metrics_name = name
+
+    def update_gauges():
+        try:
+            from app.monitoring.services.metrics import db_pool_checked_out, db_pool_overflow, db_pool_size
+            db_pool_checked_out.labels(engine=name).set(pool.checkedout())
+            db_pool_overflow.labels(engine=name).set(max(0, pool.overflow()))
+            db_pool_size.labels(engine=name).set(pool.size())
+        except Exception as e:
+            logger.debug(f"DB 풀 메트릭 업데이트 실패: {e}")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        update_gauges()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        update_gauges()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        try:
+            from app.monitoring.services.metrics import db_pool_invalidations_total
+            db_pool_invalidations_total.labels(engine=name).inc()
+        except Exception as e:
+            logger.debug(f"DB 풀 무효화 메트릭 업데이트 실패: {e}")
+        logger.warning(f"DB 커넥션 무효화 ({name}): {exception}")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -7,12 +7,25 @@ from app.database.core.database import Base
 
 class UserAnalysisJob(Base):
     __tablename__ = "user_analysis_jobs"
+    __table_args__ = (
+        # 사용자별 최신순 목록 / 작업 유형별 목록 (filesort 없이 키셋 페이지 조회)
+        Index("ix_user_analysis_jobs_user_created", "user_id", "created_at"),
+        Index("ix_user_analysis_jobs_user_type_created", "user_id", "job_type", "created_at"),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(255), nullable=False, index=True)
     job_type = Column(String(50), nullable=False)  # 'youtube', 'document'
-    status = Column(String(20), default='processing')  # 'processing', 'completed', 'failed'
+    status = Column(String(20), default='processing', index=True)  # 'processing', 'completed', 'failed'
     input_data = Column(JSON)
+    video_id = Column(String(64), index=True)  # 완료된 리포트 재사용 조회용
+    pipeline_version = Column(String(20))
+    # 기존 리포트를 재사용한 작업이면 원본 작업 ID (재사용 원본으로 다시 쓰이지 않도록)
+    reused_from_job_id = Column(String(36))
+    # 작업 대기열 (JOB_QUEUE_BACKEND=database): 작업을 가져간 워커와 마지막 하트비트
+    worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime)
+    attempts = Column(Integer, default=0)
     result_s3_key = Column(String(500))
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
@@ -23,13 +36,23 @@ class UserAnalysisJob(Base):
 
 class UserReport(Base):
     __tablename__ = "user_reports"
+    __table_args__ = (
+        Index("ix_user_reports_user_created", "user_id", "created_at"),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    job_id = Column(String(36), ForeignKey("user_analysis_jobs.id"))
+    job_id = Column(String(36), ForeignKey("user_analysis_jobs.id"), index=True)
     user_id = Column(String(255), nullable=False, index=True)
     title = Column(String(500))
     s3_key = Column(String(500))
     file_type = Column(String(10))  # 'json', 'txt', 'pdf'
+    # 보고서 목록 조회용 YouTube 메타데이터 (S3 리포트를 열지 않고 목록 구성)
+    youtube_url = Column(String(500))
+    youtube_title = Column(String(500))
+    youtube_channel = Column(String(255))
+    youtube_duration = Column(String(50))
+    youtube_thumbnail = Column(String(500))
+    video_id = Column(String(64))
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계
@@ -37,6 +60,9 @@ class UserReport(Base):
 
 class UserAudioFile(Base):
     __tablename__ = "user_audio_files"
+    __table_args__ = (
+        Index("ix_user_audio_files_user_created", "user_id", "created_at"),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     job_id = Column(String(36), ForeignKey("user_analysis_jobs.id"))
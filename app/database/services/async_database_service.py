@@ -0,0 +1,157 @@
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from app.database.models.database_models import UserAnalysisJob, UserReport, UserAudioFile
+from app.database.core.pagination import keyset_filter, keyset_order, split_page
+
+
+class AsyncDatabaseService:
+    """
+    async 엔드포인트용 DatabaseService (AsyncSession 사용)
+
+    쿼리 조건/동작은 DatabaseService의 같은 이름 메서드와 동일합니다.
+    작업 실행기/워커 스레드에서는 기존 동기 DatabaseService를 사용합니다.
+    """
+
+    async def create_analysis_job(self, db: AsyncSession, user_id: str, job_type: str, input_data: dict,
+                                  video_id: str = None, pipeline_version: str = None,
+                                  worker_id: str = None) -> UserAnalysisJob:
+        """분석 작업 생성 (worker_id가 없으면 대기열 워커가 가져갈 수 있음)"""
+        job = UserAnalysisJob(
+            user_id=user_id,
+            job_type=job_type,
+            input_data=input_data,
+            video_id=video_id,
+            pipeline_version=pipeline_version,
+            worker_id=worker_id,
+            attempts=0,
+            status="processing"
+        )
+        db.add(job)
+        await db.commit()
+        return job
+
+    async def update_job_status(self, db: AsyncSession, job_id: str, status: str, result_s3_key: str = None):
+        """작업 상태 업데이트"""
+        values = {UserAnalysisJob.status: status}
+        if result_s3_key:
+            values[UserAnalysisJob.result_s3_key] = result_s3_key
+        if status == "completed":
+            values[UserAnalysisJob.completed_at] = datetime.utcnow()
+        await db.execute(update(UserAnalysisJob).where(UserAnalysisJob.id == job_id).values(values))
+        await db.commit()
+
+    async def get_user_jobs(self, db: AsyncSession, user_id: str, limit: int = 50) -> List[UserAnalysisJob]:
+        """사용자 작업 목록 조회"""
+        result = await db.execute(
+            select(UserAnalysisJob)
+            .where(UserAnalysisJob.user_id == user_id)
+            .order_by(UserAnalysisJob.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_user_jobs_page(self, db: AsyncSession, user_id: str, limit: int = 50,
+                                 cursor: Optional[str] = None) -> Tuple[List[UserAnalysisJob], Optional[str]]:
+        """사용자 작업 목록 커서 페이지 (최신순, 다음 페이지가 없으면 커서 None)"""
+        query = select(UserAnalysisJob).where(UserAnalysisJob.user_id == user_id)
+        after = keyset_filter(UserAnalysisJob, cursor)
+        if after is not None:
+            query = query.where(after)
+        result = await db.execute(query.order_by(*keyset_order(UserAnalysisJob)).limit(limit + 1))
+        return split_page(list(result.scalars().all()), limit)
+
+    async def get_user_job_summaries_page(self, db: AsyncSession, user_id: str, job_type: str, limit: int = 50,
+                                          cursor: Optional[str] = None) -> Tuple[list, Optional[str]]:
+        """
+        작업 유형별 목록 커서 페이지 (목록에 필요한 컬럼만 조회)
+
+        (user_id, job_type, created_at) 인덱스로 필터/정렬하고, input_data JSON 전체 대신
+        youtube_url 값만 추출합니다. 각 행은 id, status, youtube_url, created_at, completed_at 속성을 가집니다.
+        """
+        query = select(
+            UserAnalysisJob.id,
+            UserAnalysisJob.status,
+            UserAnalysisJob.input_data["youtube_url"].as_string().label("youtube_url"),
+            UserAnalysisJob.created_at,
+            UserAnalysisJob.completed_at
+        ).where(
+            UserAnalysisJob.user_id == user_id,
+            UserAnalysisJob.job_type == job_type
+        )
+        after = keyset_filter(UserAnalysisJob, cursor)
+        if after is not None:
+            query = query.where(after)
+        result = await db.execute(query.order_by(*keyset_order(UserAnalysisJob)).limit(limit + 1))
+        return split_page(list(result.all()), limit)
+
+    async def get_job_by_id(self, db: AsyncSession, job_id: str, user_id: str) -> Optional[UserAnalysisJob]:
+        """작업 ID로 조회 (사용자 권한 확인)"""
+        result = await db.execute(
+            select(UserAnalysisJob).where(
+                UserAnalysisJob.id == job_id,
+                UserAnalysisJob.user_id == user_id
+            )
+        )
+        return result.scalars().first()
+
+    async def requeue_job(self, db: AsyncSession, job_id: str, worker_id: str = None):
+        """실패한 작업을 다시 진행 중으로 되돌림 (worker_id가 없으면 대기열 워커가 가져감)"""
+        await db.execute(
+            update(UserAnalysisJob).where(UserAnalysisJob.id == job_id).values({
+                UserAnalysisJob.status: "processing",
+                UserAnalysisJob.worker_id: worker_id,
+                UserAnalysisJob.heartbeat_at: None,
+                UserAnalysisJob.attempts: 0,
+                UserAnalysisJob.completed_at: None
+            })
+        )
+        await db.commit()
+
+    async def get_report_by_job_id(self, db: AsyncSession, job_id: str, user_id: str) -> Optional[UserReport]:
+        """작업 ID로 보고서 조회 (사용자 권한 확인)"""
+        result = await db.execute(
+            select(UserReport).where(
+                UserReport.job_id == job_id,
+                UserReport.user_id == user_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_user_reports(self, db: AsyncSession, user_id: str, limit: int = 50,
+                               file_type: Optional[str] = None) -> List[UserReport]:
+        """사용자 보고서 목록 (file_type을 주면 LIMIT 전에 해당 형식만 조회)"""
+        query = select(UserReport).where(UserReport.user_id == user_id)
+        if file_type:
+            query = query.where(UserReport.file_type == file_type)
+        result = await db.execute(query.order_by(UserReport.created_at.desc()).limit(limit))
+        return list(result.scalars().all())
+
+    async def delete_user_report(self, db: AsyncSession, job_id: str, user_id: str) -> bool:
+        """보고서 행 삭제 (사용자 권한 확인)"""
+        result = await db.execute(
+            delete(UserReport).where(
+                UserReport.job_id == job_id,
+                UserReport.user_id == user_id
+            )
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    async def delete_job(self, db: AsyncSession, job_id: str, user_id: str) -> bool:
+        """작업 삭제 (사용자 권한 확인)"""
+        job = await self.get_job_by_id(db, job_id, user_id)
+        if not job:
+            return False
+
+        # 관련 보고서와 오디오 파일도 삭제
+        # (session.delete는 cascade 관계를 지연 로딩하므로 AsyncSession에서는 DELETE 문으로 처리)
+        await db.execute(delete(UserReport).where(UserReport.job_id == job_id))
+        await db.execute(delete(UserAudioFile).where(UserAudioFile.job_id == job_id))
+        await db.execute(delete(UserAnalysisJob).where(UserAnalysisJob.id == job_id))
+        await db.commit()
+        return True
+
+async_database_service = AsyncDatabaseService()
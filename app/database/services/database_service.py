@@ -1,18 +1,26 @@
+from sqlalchemy import or_, func
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import uuid
 
 from app.database.models.database_models import UserAnalysisJob, UserReport, UserAudioFile
 from app.database.core.database import get_db
+from app.database.core.pagination import keyset_filter, keyset_order, split_page
 
 class DatabaseService:
-    def create_analysis_job(self, db: Session, user_id: str, job_type: str, input_data: dict) -> UserAnalysisJob:
-        """분석 작업 생성"""
+    def create_analysis_job(self, db: Session, user_id: str, job_type: str, input_data: dict,
+                            video_id: str = None, pipeline_version: str = None,
+                            worker_id: str = None) -> UserAnalysisJob:
+        """분석 작업 생성 (worker_id가 없으면 대기열 워커가 가져갈 수 있음)"""
         job = UserAnalysisJob(
             user_id=user_id,
             job_type=job_type,
             input_data=input_data,
+            video_id=video_id,
+            pipeline_version=pipeline_version,
+            worker_id=worker_id,
+            attempts=0,
             status="processing"
         )
         db.add(job)
@@ -31,12 +39,76 @@ class DatabaseService:
                 job.completed_at = datetime.utcnow()
             db.commit()
     
+    def complete_job(self, db: Session, job_id: str, user_id: str, status: str, result_s3_key: str = None,
+                     report: Optional[Dict[str, Any]] = None, audio: Optional[Dict[str, Any]] = None,
+                     reused_from_job_id: str = None, worker_id: str = None) -> bool:
+        """
+        작업 종료 처리를 한 트랜잭션으로 저장 (작업 상태 + 보고서 행 + 오디오 행)
+
+        report: title, s3_key, file_type, youtube_metadata
+        audio: s3_key, duration
+        reused_from_job_id: 기존 리포트를 재사용한 경우 원본 작업 ID
+        worker_id: 지정하면 이 워커가 소유한 작업일 때만 저장
+
+        아직 진행 중(processing)인 작업만 종료 처리합니다. 그 사이 취소됐거나 다른 워커가
+        작업을 가져갔으면 아무것도 저장하지 않고 False를 반환합니다.
+        중간에 실패하면 아무것도 저장하지 않고 롤백합니다. 저장한 객체를 다시 읽지 않으므로 refresh하지 않습니다.
+        """
+        values = {UserAnalysisJob.status: status}
+        if result_s3_key:
+            values[UserAnalysisJob.result_s3_key] = result_s3_key
+        if status == "completed":
+            values[UserAnalysisJob.completed_at] = datetime.utcnow()
+        if reused_from_job_id:
+            values[UserAnalysisJob.reused_from_job_id] = reused_from_job_id
+
+        try:
+            query = db.query(UserAnalysisJob).filter(
+                UserAnalysisJob.id == job_id,
+                UserAnalysisJob.status == "processing"
+            )
+            if worker_id:
+                query = query.filter(UserAnalysisJob.worker_id == worker_id)
+
+            if query.update(values, synchronize_session=False) == 0:
+                db.rollback()
+                return False
+
+            if report:
+                db.add(UserReport(
+                    job_id=job_id,
+                    user_id=user_id,
+                    title=report.get("title"),
+                    s3_key=report["s3_key"],
+                    file_type=report.get("file_type", "json"),
+                    **self._report_index_fields(report.get("youtube_metadata") or {})
+                ))
+
+            if audio:
+                db.add(UserAudioFile(
+                    job_id=job_id,
+                    user_id=user_id,
+                    s3_key=audio["s3_key"],
+                    duration=audio.get("duration", 0)
+                ))
+
+            db.commit()
+            return True
+        except Exception:
+            db.rollback()
+            raise
+
     def get_user_jobs(self, db: Session, user_id: str, limit: int = 50) -> List[UserAnalysisJob]:
         """사용자 작업 목록 조회"""
         return db.query(UserAnalysisJob).filter(
             UserAnalysisJob.user_id == user_id
         ).order_by(UserAnalysisJob.created_at.desc()).limit(limit).all()
     
+    def get_user_jobs_page(self, db: Session, user_id: str, limit: int = 50,
+                           cursor: Optional[str] = None) -> Tuple[List[UserAnalysisJob], Optional[str]]:
+        """사용자 작업 목록 커서 페이지 (최신순, 다음 페이지가 없으면 커서 None)"""
+        return self._user_page(db, UserAnalysisJob, user_id, limit, cursor)
+
     def get_job_by_id(self, db: Session, job_id: str, user_id: str) -> Optional[UserAnalysisJob]:
         """작업 ID로 조회 (사용자 권한 확인)"""
         return db.query(UserAnalysisJob).filter(
@@ -44,14 +116,94 @@ class DatabaseService:
             UserAnalysisJob.user_id == user_id
         ).first()
     
-    def create_user_report(self, db: Session, job_id: str, user_id: str, title: str, s3_key: str, file_type: str) -> UserReport:
-        """사용자 보고서 생성"""
+    def find_reusable_job(self, db: Session, video_id: str, pipeline_version: str, since: datetime,
+                          exclude_job_id: str = None) -> Optional[UserAnalysisJob]:
+        """같은 영상 + 파이프라인 버전으로 최근 직접 분석해 완료된 작업 조회 (사용자 무관)"""
+        query = db.query(UserAnalysisJob).filter(
+            UserAnalysisJob.video_id == video_id,
+            UserAnalysisJob.pipeline_version == pipeline_version,
+            UserAnalysisJob.status == "completed",
+            UserAnalysisJob.result_s3_key.isnot(None),
+            UserAnalysisJob.completed_at >= since,
+            # 재사용으로 만들어진 작업은 completed_at이 새로 찍히므로 원본 생성 작업만 대상
+            UserAnalysisJob.reused_from_job_id.is_(None)
+        )
+        if exclude_job_id:
+            query = query.filter(UserAnalysisJob.id != exclude_job_id)
+        return query.order_by(UserAnalysisJob.completed_at.desc()).first()
+
+    def claim_next_job(self, db: Session, worker_id: str, job_type: str, stale_before: datetime,
+                       created_after: datetime, max_attempts: int) -> Optional[UserAnalysisJob]:
+        """
+        대기 중인 작업 하나를 워커 소유로 가져오기
+
+        아직 아무 워커도 가져가지 않았거나, 하트비트가 stale_before 이전에 끊긴 작업을
+        SELECT ... FOR UPDATE SKIP LOCKED로 잠가 여러 워커가 같은 작업을 가져가지 않도록 합니다.
+        """
+        job = db.query(UserAnalysisJob).filter(
+            UserAnalysisJob.status == "processing",
+            UserAnalysisJob.job_type == job_type,
+            UserAnalysisJob.created_at >= created_after,
+            func.coalesce(UserAnalysisJob.attempts, 0) < max_attempts,
+            or_(UserAnalysisJob.worker_id.is_(None), UserAnalysisJob.heartbeat_at < stale_before)
+        ).order_by(UserAnalysisJob.created_at.asc()).with_for_update(skip_locked=True).first()
+
+        if not job:
+            db.rollback()
+            return None
+
+        job.worker_id = worker_id
+        job.heartbeat_at = datetime.utcnow()
+        job.attempts = (job.attempts or 0) + 1
+        db.commit()
+        return job
+
+    def heartbeat_job(self, db: Session, job_id: str, worker_id: str) -> bool:
+        """작업 하트비트 갱신 (다른 워커가 작업을 가져갔으면 False)"""
+        updated = db.query(UserAnalysisJob).filter(
+            UserAnalysisJob.id == job_id,
+            UserAnalysisJob.worker_id == worker_id,
+            UserAnalysisJob.status == "processing"
+        ).update({UserAnalysisJob.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+        return updated > 0
+
+    def fail_exhausted_jobs(self, db: Session, job_type: str, stale_before: datetime, max_attempts: int) -> int:
+        """재시도 횟수를 모두 쓰고 하트비트가 끊긴 작업을 실패 처리"""
+        updated = db.query(UserAnalysisJob).filter(
+            UserAnalysisJob.status == "processing",
+            UserAnalysisJob.job_type == job_type,
+            UserAnalysisJob.attempts >= max_attempts,
+            UserAnalysisJob.heartbeat_at < stale_before
+        ).update({UserAnalysisJob.status: "failed"}, synchronize_session=False)
+        db.commit()
+        return updated
+
+    def requeue_job(self, db: Session, job_id: str, worker_id: str = None):
+        """실패한 작업을 다시 진행 중으로 되돌림 (worker_id가 없으면 대기열 워커가 가져감)"""
+        db.query(UserAnalysisJob).filter(UserAnalysisJob.id == job_id).update({
+            UserAnalysisJob.status: "processing",
+            UserAnalysisJob.worker_id: worker_id,
+            UserAnalysisJob.heartbeat_at: None,
+            UserAnalysisJob.attempts: 0,
+            UserAnalysisJob.completed_at: None
+        }, synchronize_session=False)
+        db.commit()
+
+    def get_job_audio(self, db: Session, job_id: str) -> Optional[UserAudioFile]:
+        """작업에 연결된 오디오 파일 조회"""
+        return db.query(UserAudioFile).filter(UserAudioFile.job_id == job_id).first()
+
+    def create_user_report(self, db: Session, job_id: str, user_id: str, title: str, s3_key: str, file_type: str,
+                           youtube_metadata: Optional[Dict[str, Any]] = None) -> UserReport:
+        """사용자 보고서 생성 (목록 조회용 YouTube 메타데이터 포함)"""
         report = UserReport(
             job_id=job_id,
             user_id=user_id,
             title=title,
             s3_key=s3_key,
-            file_type=file_type
+            file_type=file_type,
+            **self._report_index_fields(youtube_metadata or {})
         )
         db.add(report)
         db.commit()
@@ -71,18 +223,65 @@ class DatabaseService:
         db.refresh(audio)
         return audio
     
+    def get_report_by_job_id(self, db: Session, job_id: str, user_id: str) -> Optional[UserReport]:
+        """작업 ID로 보고서 조회 (사용자 권한 확인)"""
+        return db.query(UserReport).filter(
+            UserReport.job_id == job_id,
+            UserReport.user_id == user_id
+        ).first()
+
     def get_user_reports(self, db: Session, user_id: str, limit: int = 50) -> List[UserReport]:
         """사용자 보고서 목록"""
         return db.query(UserReport).filter(
             UserReport.user_id == user_id
         ).order_by(UserReport.created_at.desc()).limit(limit).all()
     
+    def update_report_index(self, db: Session, report: UserReport, youtube_metadata: Dict[str, Any]):
+        """기존 보고서 행에 목록 조회용 메타데이터 채우기 (백필용)"""
+        for field, value in self._report_index_fields(youtube_metadata).items():
+            setattr(report, field, value)
+        db.commit()
+
+    def _report_index_fields(self, youtube_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """리포트 metadata에서 user_reports 인덱스 컬럼 값 추출"""
+        return {
+            "youtube_url": youtube_metadata.get("youtube_url") or None,
+            "youtube_title": youtube_metadata.get("youtube_title") or None,
+            "youtube_channel": youtube_metadata.get("youtube_channel") or None,
+            "youtube_duration": youtube_metadata.get("youtube_duration") or None,
+            "youtube_thumbnail": youtube_metadata.get("youtube_thumbnail") or None,
+            "video_id": youtube_metadata.get("video_id") or None
+        }
+
+    def delete_user_report(self, db: Session, job_id: str, user_id: str) -> bool:
+        """보고서 행 삭제 (사용자 권한 확인)"""
+        deleted = db.query(UserReport).filter(
+            UserReport.job_id == job_id,
+            UserReport.user_id == user_id
+        ).delete()
+        db.commit()
+        return deleted > 0
+
     def get_user_audio_files(self, db: Session, user_id: str, limit: int = 50) -> List[UserAudioFile]:
         """사용자 오디오 파일 목록"""
         return db.query(UserAudioFile).filter(
             UserAudioFile.user_id == user_id
         ).order_by(UserAudioFile.created_at.desc()).limit(limit).all()
     
+    def get_user_audio_files_page(self, db: Session, user_id: str, limit: int = 50,
+                                  cursor: Optional[str] = None) -> Tuple[List[UserAudioFile], Optional[str]]:
+        """사용자 오디오 파일 목록 커서 페이지"""
+        return self._user_page(db, UserAudioFile, user_id, limit, cursor)
+
+    def _user_page(self, db: Session, model, user_id: str, limit: int, cursor: Optional[str]):
+        """(user_id, created_at) 인덱스를 따라가는 키셋 페이지 조회 (잘못된 커서는 InvalidCursorError)"""
+        query = db.query(model).filter(model.user_id == user_id)
+        after = keyset_filter(model, cursor)
+        if after is not None:
+            query = query.filter(after)
+        rows = query.order_by(*keyset_order(model)).limit(limit + 1).all()
+        return split_page(rows, limit)
+
     def delete_job(self, db: Session, job_id: str, user_id: str) -> bool:
         """작업 삭제 (사용자 권한 확인)"""
         job = db.query(UserAnalysisJob).filter(
@@ -103,10 +302,12 @@ database_service = DatabaseService()
 
 # 비동기 함수들 (프론트엔드 호환성을 위해)
 async def get_user_jobs(username: str):
-    """사용자 작업 목록 조회 (비동기)"""
-    db = next(get_db())
-    try:
-        jobs = database_service.get_user_jobs(db, username)
+    """사용자 작업 목록 조회 (비동기, 이벤트 루프를 막지 않도록 비동기 세션 사용)"""
+    from app.database.core.database import AsyncSessionLocal
+    from app.database.services.async_database_service import async_database_service
+
+    async with AsyncSessionLocal() as db:
+        jobs = await async_database_service.get_user_jobs(db, username)
         return [{
             "id": job.id,
             "status": job.status,
@@ -115,8 +316,6 @@ async def get_user_jobs(username: str):
             "created_at": job.created_at.isoformat() if job.created_at else None,
             "completed_at": job.completed_at.isoformat() if job.completed_at else None
         } for job in jobs]
-    finally:
-        db.close()
 
 async def get_job_progress(job_id: str):
     """작업 진행률 조회 (비동기)"""
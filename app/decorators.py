@@ -3,6 +3,8 @@ import functools
 import logging
 from typing import Callable, Any
 
+from app.analyze.services.state_manager import JobCancelledError
+
 logger = logging.getLogger(__name__)
 
 def track_youtube_job(stage_name: str):
@@ -58,6 +60,16 @@ def track_llm_call(agent_name: str):
                     logger.warning(f"LLM 메트릭 업데이트 실패: {e}")
                 
                 return result
+            except JobCancelledError:
+                # 사용자 취소는 실패 메트릭/에러 로그에 포함하지 않음
+                try:
+                    from app.monitoring.services.metrics import llm_call_total
+                    llm_call_total.labels(agent=agent_name, status='cancelled').inc()
+                except:
+                    pass
+
+                logger.info(f"LLM 호출 취소됨 ({agent_name})")
+                raise
             except Exception as e:
                 # 실패 메트릭 업데이트
                 try:
@@ -45,6 +45,14 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.analyze.services.job_executor import job_executor
+    job_executor.shutdown(wait=False)
+
+    from app.database.core.database import async_engine
+    await async_engine.dispose()
+
 # 라우터 등록 
 app.include_router(auth_router)
 app.include_router(analyze_router)
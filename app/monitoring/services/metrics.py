@@ -31,6 +31,80 @@ llm_call_duration = Histogram(
     ['agent']
 )
 
+# 워크플로우 노드 메트릭
+workflow_node_duration = Histogram(
+    'workflow_node_duration_seconds',
+    'Time spent on each analysis workflow node',
+    ['node']
+)
+
+workflow_parallel_saved_seconds = Histogram(
+    'workflow_parallel_saved_seconds',
+    'Wall-clock time saved by running workflow nodes in parallel'
+)
+
+# 분석 작업 대기열 메트릭
+analysis_queue_depth = Gauge(
+    'analysis_queue_depth',
+    'Number of analysis jobs waiting for a worker'
+)
+
+analysis_running_jobs = Gauge(
+    'analysis_running_jobs',
+    'Number of analysis jobs currently running in this process'
+)
+
+analysis_queue_wait_seconds = Histogram(
+    'analysis_queue_wait_seconds',
+    'Time analysis jobs spend queued before a worker picks them up'
+)
+
+analysis_queue_rejected_total = Counter(
+    'analysis_queue_rejected_total',
+    'Analysis jobs rejected because the queue was full'
+)
+
+# 작업 취소로 실행하지 않은 LLM 호출 (추정)
+llm_calls_saved_total = Counter(
+    'llm_calls_saved_total',
+    'Estimated LLM calls skipped because the job was cancelled'
+)
+
+# LLM 응답 캐시 메트릭
+llm_cache_requests_total = Counter(
+    'llm_cache_requests_total',
+    'LLM response cache lookups',
+    ['agent', 'result']
+)
+
+# 자막 캐시 메트릭
+caption_cache_requests_total = Counter(
+    'caption_cache_requests_total',
+    'Caption cache lookups by tier and result',
+    ['tier', 'result']
+)
+
+# 사전 서명 URL 캐시 메트릭
+presigned_url_cache_requests_total = Counter(
+    'presigned_url_cache_requests_total',
+    'Presigned URL cache lookups',
+    ['result']
+)
+
+# 리포트 조회 캐시 메트릭 (hit: ETag 일치로 다운로드 생략)
+report_cache_requests_total = Counter(
+    'report_cache_requests_total',
+    'Parsed report cache lookups',
+    ['result']
+)
+
+# 리포트 재사용 메트릭
+report_reuse_total = Counter(
+    'report_reuse_total',
+    'Completed report reuse lookups',
+    ['result']
+)
+
 # API 요청 메트릭
 api_request_count = Counter(
     'api_requests_total',
@@ -44,6 +118,38 @@ api_request_duration = Histogram(
     ['method', 'endpoint', 'status_code']
 )
 
+# DB 커넥션 풀 메트릭 (engine: sync | async)
+db_pool_size = Gauge(
+    'db_pool_size',
+    'Configured connection pool size',
+    ['engine']
+)
+
+db_pool_checked_out = Gauge(
+    'db_pool_checked_out',
+    'Connections currently checked out of the pool',
+    ['engine']
+)
+
+db_pool_overflow = Gauge(
+    'db_pool_overflow',
+    'Overflow connections currently open beyond the pool size',
+    ['engine']
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting to check a connection out of the pool',
+    ['engine'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+db_pool_invalidations_total = Counter(
+    'db_pool_invalidations_total',
+    'Pooled connections invalidated (disconnects, failed pre-ping)',
+    ['engine']
+)
+
 # 시스템 메트릭
 cpu_usage = Gauge('cpu_usage_percent', 'CPU usage percentage')
 memory_usage = Gauge('memory_usage_percent', 'Memory usage percentage')
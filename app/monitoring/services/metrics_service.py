@@ -54,11 +54,8 @@ class MetricsService:
             from app.monitoring.services.metrics import active_jobs
             from app.analyze.services.state_manager import state_manager
             
-            # 현재 진행 중인 작업 수 계산
-            active_count = len([
-                job_id for job_id, progress in state_manager._progress_store.items()
-                if not progress.get("cancelled", False) and progress.get("progress", 0) < 100
-            ])
+            # 현재 진행 중인 작업 수 (저장소에서 집계)
+            active_count = state_manager.count_active_jobs()
             
             active_jobs.set(active_count)
             logger.debug(f"활성 작업 수 업데이트: {active_count}")
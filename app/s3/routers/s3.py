@@ -5,8 +5,10 @@ from app.s3.services.user_s3_service import user_s3_service
 from app.s3.services.pdf_service import pdf_service
 from app.core.config import settings
 from app.auth.core.auth import get_current_user
+from app.database.core.database import get_async_db
+from app.database.services.async_database_service import async_database_service
 from fastapi.responses import Response
-import json
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
     prefix="/s3",
@@ -59,12 +61,8 @@ async def get_s3_object(key: str) -> Dict[str, Any]:
             Key=key
         )
         
-        # 미리 서명된 URL 생성
-        url = s3_service.s3_client.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': s3_service.bucket_name, 'Key': key},
-            ExpiresIn=3600
-        )
+        # 미리 서명된 URL 생성 (만료 임박 전까지 캐시된 URL 재사용)
+        url = user_s3_service.get_presigned_url(key)
         
         return {
             "key": key,
@@ -78,68 +76,66 @@ async def get_s3_object(key: str) -> Dict[str, Any]:
         raise HTTPException(status_code=404, detail=f"S3 객체를 찾을 수 없음: {str(e)}")
 
 @router.get("/reports/list")
-async def list_reports_with_metadata(current_user: dict = Depends(get_current_user)) -> List[Dict[str, Any]]:
+async def list_reports_with_metadata(
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> List[Dict[str, Any]]:
     """
     보고서 목록 조회 (메타데이터 포함, 사용자별)
+
+    user_reports 인덱스 컬럼으로 목록을 구성하므로 리포트 파일을 내려받지 않습니다.
     """
     try:
         user_id = current_user["user_id"]
-        # 보고서 파일 목록 가져오기 (사용자별)
-        report_objects = s3_service.list_objects(prefix=f"reports/{user_id}/", max_keys=100)
-        
+        # 최신순 보고서 목록 (사용자별)
+        report_rows = await async_database_service.get_user_reports(db, user_id, limit=100, file_type="json")
+
         reports = []
-        for obj in report_objects:
-            if obj.get("Key", "").endswith("_report.json"):
-                try:
-                    # 보고서 파일 내용 가져오기
-                    report_content = s3_service.get_file_content(obj.get("Key", ""))
-                    if report_content:
-                        report_data = json.loads(report_content)
-                        
-                        # job_id 추출
-                        job_id = obj.get("Key", "").replace(f"reports/{user_id}/", "").replace("_report.json", "")
-                        
-                        # 보고서 내부 메타데이터 사용
-                        metadata = report_data.get("metadata", {})
-                        
-                        # 미리 서명된 URL 생성
-                        report_url = s3_service.s3_client.generate_presigned_url(
-                            'get_object',
-                            Params={'Bucket': s3_service.bucket_name, 'Key': obj.get("Key", "")},
-                            ExpiresIn=3600
-                        )
-                        
-                        reports.append({
-                            "id": job_id,
-                            "key": obj.get("Key", ""),
-                            "title": metadata.get("youtube_title", f"YouTube 분석 리포트 - {job_id[:8]}"),
-                            "youtube_url": metadata.get("youtube_url", ""),
-                            "youtube_channel": metadata.get("youtube_channel", "Unknown Channel"),
-                            "youtube_duration": metadata.get("youtube_duration", "Unknown"),
-                            "youtube_thumbnail": metadata.get("youtube_thumbnail", ""),
-                            "video_id": metadata.get("video_id", ""),
-                            "type": "YouTube",
-                            "analysis_type": metadata.get("analysis_type", "youtube_analysis"),
-                            "status": metadata.get("status", "completed"),
-                            "last_modified": obj.get("LastModified", "").isoformat() if hasattr(obj.get("LastModified", ""), "isoformat") else obj.get("LastModified", ""),
-                            "url": report_url,
-                            "metadata": metadata
-                        })
-                        
-                except Exception as e:
-                    print(f"보고서 처리 실패: {obj.get('Key', '')} - {e}")
-                    continue
-        
-        # 최신순 정렬
-        reports.sort(key=lambda x: x.get("last_modified", ""), reverse=True)
-        
+        for row in report_rows:
+            job_id = str(row.job_id)
+            metadata = {
+                "job_id": job_id,
+                "user_id": user_id,
+                "youtube_url": row.youtube_url or "",
+                "youtube_title": row.youtube_title or "",
+                "youtube_channel": row.youtube_channel or "",
+                "youtube_duration": row.youtube_duration or "",
+                "youtube_thumbnail": row.youtube_thumbnail or "",
+                "video_id": row.video_id or "",
+                "created_at": row.created_at.isoformat() if row.created_at else "",
+                "service": "youtube_reporter",
+                "analysis_type": "youtube_analysis",
+                "status": "completed"
+            }
+
+            reports.append({
+                "id": job_id,
+                "key": row.s3_key,
+                "title": row.youtube_title or f"YouTube 분석 리포트 - {job_id[:8]}",
+                "youtube_url": metadata["youtube_url"],
+                "youtube_channel": row.youtube_channel or "Unknown Channel",
+                "youtube_duration": row.youtube_duration or "Unknown",
+                "youtube_thumbnail": metadata["youtube_thumbnail"],
+                "video_id": metadata["video_id"],
+                "type": "YouTube",
+                "analysis_type": metadata["analysis_type"],
+                "status": metadata["status"],
+                "last_modified": metadata["created_at"],
+                "url": user_s3_service.get_presigned_url(row.s3_key),
+                "metadata": metadata
+            })
+
         return reports
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"보고서 목록 조회 실패: {str(e)}")
 
 @router.delete("/reports/{job_id}")
-async def delete_report(job_id: str, current_user: dict = Depends(get_current_user)) -> Dict[str, str]:
+async def delete_report(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> Dict[str, str]:
     """
     보고서 삭제
     
@@ -158,8 +154,9 @@ async def delete_report(job_id: str, current_user: dict = Depends(get_current_us
         except:
             raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다")
         
-        # 보고서 삭제
+        # 보고서 삭제 (S3 객체 + 목록 인덱스)
         user_s3_service.delete_user_file(report_key)
+        await async_database_service.delete_user_report(db, job_id, user_id)
         
         return {"message": "보고서가 성공적으로 삭제되었습니다", "job_id": job_id}
         
@@ -179,13 +176,11 @@ async def download_report_pdf(job_id: str, current_user: dict = Depends(get_curr
         user_id = current_user["user_id"]
         report_key = f"reports/{user_id}/{job_id}_report.json"
         
-        # 보고서 데이터 가져오기
-        report_content = s3_service.get_file_content(report_key)
-        if not report_content:
+        # 보고서 데이터 가져오기 (변경되지 않았으면 캐시 사용)
+        report_data = user_s3_service.get_report_json(report_key)
+        if not report_data:
             raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다")
         
-        report_data = json.loads(report_content)
-        
         # PDF 생성
         pdf_bytes = pdf_service.generate_report_pdf(report_data)
         
@@ -0,0 +1,65 @@
+"""
+리포트 저장 포맷 (직렬화 + 압축)
+
+- json: 기존 포맷 (들여쓰기된 UTF-8 JSON)
+- zstd: orjson 직렬화 + zstandard 압축
+
+S3 메타데이터 report_format에 포맷을 기록하고, 읽을 때는 메타데이터가 없어도
+zstd 매직 바이트로 판별하므로 기존 객체와 새 객체를 모두 읽을 수 있습니다.
+"""
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import zstandard
+
+from app.core.config import settings
+
+FORMAT_JSON = "json-v1"
+FORMAT_ZSTD = "orjson-zstd-v1"
+
+# zstd 프레임 시작 바이트
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def encode_report(report_data: Dict[str, Any], storage_format: Optional[str] = None) -> Tuple[bytes, str]:
+    """
+    리포트를 저장용 바이트로 변환
+
+    Returns:
+        (본문 바이트, 포맷 마커)
+    """
+    storage_format = (storage_format or settings.REPORT_STORAGE_FORMAT or "json").lower()
+
+    if storage_format == "zstd":
+        payload = orjson.dumps(report_data)
+        # 압축 객체는 스레드 안전하지 않으므로 호출마다 생성
+        compressor = zstandard.ZstdCompressor(level=settings.REPORT_ZSTD_LEVEL)
+        return compressor.compress(payload), FORMAT_ZSTD
+
+    return json.dumps(report_data, ensure_ascii=False, indent=2).encode("utf-8"), FORMAT_JSON
+
+
+def is_compressed(data: bytes, report_format: Optional[str] = None) -> bool:
+    """압축된 리포트인지 (메타데이터 우선, 없으면 매직 바이트로 판별)"""
+    if report_format:
+        return report_format == FORMAT_ZSTD
+    return data[:4] == ZSTD_MAGIC
+
+
+def decode_bytes(data: bytes, report_format: Optional[str] = None) -> bytes:
+    """저장된 본문을 JSON 바이트로 복원 (압축되지 않은 객체는 그대로 반환)"""
+    if is_compressed(data, report_format):
+        # 스트리밍으로 압축된 프레임은 원본 크기가 헤더에 없을 수 있음
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def decode_text(data: bytes, report_format: Optional[str] = None) -> str:
+    """저장된 본문을 JSON 문자열로 복원"""
+    return decode_bytes(data, report_format).decode("utf-8")
+
+
+def decode_report(data: bytes, report_format: Optional[str] = None) -> Dict[str, Any]:
+    """저장된 본문을 리포트 dict로 파싱"""
+    return orjson.loads(decode_bytes(data, report_format))
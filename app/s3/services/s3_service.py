@@ -1,6 +1,7 @@
 import boto3
 import os
 from app.core.config import settings
+from app.s3.services import report_codec
 
 class S3Service:
     def __init__(self):
@@ -66,7 +67,11 @@ class S3Service:
                 Bucket=self.bucket_name,
                 Key=object_name
             )
-            content = response['Body'].read().decode('utf-8')
+            # 압축 저장된 리포트는 풀어서 반환
+            content = report_codec.decode_text(
+                response['Body'].read(),
+                response.get('Metadata', {}).get('report_format')
+            )
             print(f"✅ S3 파일 내용 읽기 성공: {object_name}")
             return content
         except Exception as e:
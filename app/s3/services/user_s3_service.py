@@ -1,9 +1,13 @@
 import boto3
 import json
 import time
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
+from botocore.exceptions import ClientError
+from app.core.cache import LRUCache
 from app.core.config import settings
+from app.s3.services import report_codec
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,24 +16,48 @@ class UserS3Service:
     def __init__(self):
         self.s3_client = boto3.client('s3', region_name=settings.AWS_REGION)
         self.bucket_name = settings.AWS_S3_BUCKET
+        # s3_key -> (ETag, 파싱된 리포트)
+        self._report_cache = LRUCache(max_entries=settings.REPORT_CACHE_MAX_ENTRIES)
+        # (s3_key, expires_in) -> 사전 서명 URL (항목별 TTL = 재사용 가능 시간)
+        self._presigned_urls = LRUCache(max_entries=settings.PRESIGNED_URL_CACHE_MAX_ENTRIES)
     
-    def upload_user_report(self, user_id: str, job_id: str, content: str, file_type: str = "json") -> str:
+    def upload_report_data(self, user_id: str, job_id: str, report_data: Dict[str, Any]) -> str:
+        """
+        JSON 리포트 업로드 (REPORT_STORAGE_FORMAT 포맷으로 직렬화/압축)
+        """
+        body, report_format = report_codec.encode_report(report_data)
+        logger.info(f"📦 리포트 직렬화: {job_id} ({report_format}, {len(body)} bytes)")
+        return self.upload_user_report(
+            user_id=user_id,
+            job_id=job_id,
+            content=body,
+            file_type="json",
+            report_format=report_format
+        )
+
+    def upload_user_report(self, user_id: str, job_id: str, content: Union[str, bytes], file_type: str = "json",
+                           report_format: Optional[str] = None) -> str:
         """
         보고서 업로드 (대시보드 호환 경로: reports/{user_id}/{job_id}_report.{file_type})
         """
         start_time = time.time()
         try:
             key = f"reports/{user_id}/{job_id}_report.{file_type}"
+            metadata = {
+                "user_id": user_id,
+                "job_id": job_id,
+                "created_at": datetime.utcnow().isoformat()
+            }
+            # 포맷은 메타데이터와 매직 바이트로 판별 (ContentEncoding을 붙이면 zstd 미지원 클라이언트가 presigned URL을 못 읽음)
+            if report_format:
+                metadata["report_format"] = report_format
+
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=content,
                 ContentType=f"application/{file_type}",
-                Metadata={
-                    "user_id": user_id,
-                    "job_id": job_id,
-                    "created_at": datetime.utcnow().isoformat()
-                }
+                Metadata=metadata
             )
             
             # S3 업로드 성공 메트릭 업데이트
@@ -100,47 +128,116 @@ class UserS3Service:
             raise Exception(f"오디오 업로드 실패: {str(e)}")
   
     
-    def get_user_files(self, user_id: str, file_type: str = None) -> List[Dict]:
+    def copy_user_audio(self, source_key: str, user_id: str, job_id: str) -> str:
+        """
+        다른 작업의 오디오 파일을 사용자별 경로로 복사 (리포트 재사용 시)
+        """
+        try:
+            key = f"audio/{user_id}/{job_id}_audio.mp3"
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                CopySource={"Bucket": self.bucket_name, "Key": source_key},
+                ContentType="audio/mpeg",
+                MetadataDirective="REPLACE",
+                Metadata={
+                    "user_id": user_id,
+                    "job_id": job_id,
+                    "created_at": datetime.utcnow().isoformat()
+                }
+            )
+            return key
+        except Exception as e:
+            raise Exception(f"오디오 복사 실패: {str(e)}")
+
+    def get_user_files(self, user_id: str, file_type: str = None, include_metadata: bool = True,
+                       max_keys: Optional[int] = None) -> List[Dict]:
         """
         사용자 파일 목록 조회 (reports, audio, visuals)
+
+        - 1000개를 넘는 접두사도 페이지 단위로 모두 조회 (max_keys로 개수 제한 가능)
+        - include_metadata=False면 head_object 없이 목록 정보만 반환
+        - 메타데이터는 S3_METADATA_MAX_CONCURRENCY개씩 동시에 조회
         """
         try:
             if file_type:
                 prefix = f"{file_type}/{user_id}/"
             else:
                 prefix = f"{user_id}/"
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+
             files = []
-            for obj in response.get('Contents', []):
-                metadata_response = self.s3_client.head_object(
-                    Bucket=self.bucket_name,
-                    Key=obj['Key']
-                )
-                files.append({
-                    "key": obj['Key'],
-                    "size": obj['Size'],
-                    "last_modified": obj['LastModified'].isoformat(),
-                    "metadata": metadata_response.get('Metadata', {})
-                })
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    files.append({
+                        "key": obj['Key'],
+                        "size": obj['Size'],
+                        "last_modified": obj['LastModified'].isoformat()
+                    })
+                if max_keys and len(files) >= max_keys:
+                    files = files[:max_keys]
+                    break
+
+            if include_metadata and files:
+                self._attach_metadata(files)
             return files
         except Exception as e:
             raise Exception(f"파일 목록 조회 실패: {str(e)}")
+
+    def _attach_metadata(self, files: List[Dict]):
+        """파일별 사용자 메타데이터를 제한된 동시성으로 조회해 채움 (실패한 항목은 빈 dict)"""
+        def head(key: str) -> Dict[str, str]:
+            try:
+                return self.s3_client.head_object(Bucket=self.bucket_name, Key=key).get('Metadata', {})
+            except Exception as e:
+                logger.warning(f"파일 메타데이터 조회 실패: {key} - {e}")
+                return {}
+
+        max_workers = max(1, min(settings.S3_METADATA_MAX_CONCURRENCY, len(files)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-head") as executor:
+            for file, metadata in zip(files, executor.map(head, [f["key"] for f in files])):
+                file["metadata"] = metadata
     
-    def get_presigned_url(self, s3_key: str, expires_in: int = 3600) -> str:
+    def get_presigned_url(self, s3_key: str, expires_in: Optional[int] = None) -> str:
         """
-        사전 서명된 URL 생성
+        사전 서명된 URL 생성 (만료 임박 전까지 같은 URL 재사용)
+
+        만료까지 PRESIGNED_URL_REFRESH_MARGIN_SECONDS보다 많이 남아 있는 동안 캐시된 URL을
+        반환합니다. SigV4 URL에는 서명 시각(X-Amz-Date)이 들어가므로 같은 URL은 이 프로세스의
+        캐시에서만 재사용되고, Pod/워커마다 서로 다른 URL이 만들어집니다.
         """
+        expires_in = expires_in or settings.PRESIGNED_URL_EXPIRES_SECONDS
+        cache_key = (s3_key, expires_in)
+
+        url = self._presigned_urls.get(cache_key)
+        if url:
+            self._record_presigned_url_cache("hit")
+            return url
+        self._record_presigned_url_cache("miss")
+
+        # SigV4 서명 URL 최대 유효 기간은 7일
+        expires_in = min(expires_in, 604800)
+
         try:
-            return self.s3_client.generate_presigned_url(
+            url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expires_in
             )
         except Exception as e:
             raise Exception(f"URL 생성 실패: {str(e)}")
+
+        reuse_for = expires_in - settings.PRESIGNED_URL_REFRESH_MARGIN_SECONDS
+        if reuse_for > 0:
+            self._presigned_urls.set(cache_key, url, ttl=reuse_for)
+        return url
+
+    def _record_presigned_url_cache(self, result: str):
+        try:
+            from app.monitoring.services.metrics import presigned_url_cache_requests_total
+            presigned_url_cache_requests_total.labels(result=result).inc()
+        except Exception as e:
+            logger.warning(f"URL 캐시 메트릭 업데이트 실패: {e}")
     
     def upload_text_content(self, s3_key: str, content: str) -> str:
         """
@@ -184,18 +281,62 @@ class UserS3Service:
     
     def get_file_content(self, s3_key: str) -> str:
         """
-        파일 내용 가져오기
+        파일 내용 가져오기 (압축 저장된 리포트는 풀어서 반환)
         """
         try:
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
-            return response['Body'].read().decode('utf-8')
+            return report_codec.decode_text(
+                response['Body'].read(),
+                response.get('Metadata', {}).get('report_format')
+            )
         except Exception as e:
             logger.error(f"파일 내용 조회 실패: {str(e)}")
             return ""
     
+    def get_report_json(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON 리포트 조회 (S3 키 + ETag 기준 캐시)
+
+        캐시된 리포트가 있으면 If-None-Match 조건부 요청으로 변경 여부만 확인하고,
+        변경되지 않았으면(304) 다운로드/파싱 없이 캐시된 객체를 반환합니다.
+        반환된 dict는 여러 요청이 공유하므로 수정하지 마세요.
+        """
+        cached = self._report_cache.get(s3_key)
+        params = {"Bucket": self.bucket_name, "Key": s3_key}
+        if cached:
+            params["IfNoneMatch"] = cached[0]
+
+        try:
+            response = self.s3_client.get_object(**params)
+        except ClientError as e:
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if cached and (status == 304 or e.response.get("Error", {}).get("Code") == "304"):
+                self._record_report_cache("hit")
+                return cached[1]
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                self._report_cache.pop(s3_key)
+                return None
+            logger.error(f"리포트 조회 실패: {s3_key} - {e}")
+            return None
+
+        self._record_report_cache("miss")
+        report = report_codec.decode_report(
+            response['Body'].read(),
+            response.get('Metadata', {}).get('report_format')
+        )
+        self._report_cache.set(s3_key, (response.get("ETag"), report))
+        return report
+
+    def _record_report_cache(self, result: str):
+        try:
+            from app.monitoring.services.metrics import report_cache_requests_total
+            report_cache_requests_total.labels(result=result).inc()
+        except Exception as e:
+            logger.warning(f"리포트 캐시 메트릭 업데이트 실패: {e}")
+
     def delete_user_file(self, s3_key: str):
         """
         사용자 파일 삭제
@@ -205,6 +346,11 @@ class UserS3Service:
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
+            self._report_cache.pop(s3_key)
+            # 만료 시간별로 캐시된 URL을 모두 제거
+            for cache_key, _ in self._presigned_urls.items():
+                if cache_key[0] == s3_key:
+                    self._presigned_urls.pop(cache_key)
         except Exception as e:
             raise Exception(f"파일 삭제 실패: {str(e)}")
 
@@ -0,0 +1,152 @@
+# app/worker.py
+"""
+분석 작업 워커 (JOB_QUEUE_BACKEND=database)
+
+API 프로세스가 user_analysis_jobs 테이블에 남겨둔 작업을 가져가 실행합니다.
+API Pod와 별도로 실행/확장할 수 있습니다.
+
+    python -m app.worker
+"""
+import time
+import signal
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import Set
+
+from app.core.config import settings
+from app.database.core.database import SessionLocal
+from app.database.services.database_service import database_service
+from app.analyze.services.job_executor import job_executor
+from app.analyze.services.state_manager import state_manager
+from app.analyze.services.youtube_analyze_service import youtube_reporter_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+JOB_TYPE = "youtube_reporter"
+
+
+class AnalysisWorker:
+    """DB 대기열에서 작업을 가져와 job_executor로 실행하고 하트비트를 유지하는 워커"""
+
+    def __init__(self):
+        self.worker_id = job_executor.worker_id
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._running_jobs: Set[str] = set()
+
+    def run(self):
+        logger.info(f"👷 분석 워커 시작: {self.worker_id} (동시 실행: {job_executor.max_workers})")
+
+        heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True)
+        heartbeat_thread.start()
+
+        while not self._stop.is_set():
+            claimed = False
+            try:
+                if job_executor.idle_workers() > 0:
+                    claimed = self._claim_and_submit()
+            except Exception as e:
+                logger.error(f"작업 가져오기 실패: {e}")
+
+            # 작업을 가져왔으면 바로 다음 작업 확인, 아니면 대기
+            if not claimed:
+                self._stop.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+
+        logger.info("🛑 새 작업 수신 중단, 실행 중인 작업 완료 대기...")
+        job_executor.shutdown(wait=True)
+        logger.info("👋 분석 워커 종료")
+
+    def stop(self, *args):
+        self._stop.set()
+
+    def _claim_and_submit(self) -> bool:
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.JOB_LEASE_TIMEOUT_SECONDS)
+
+        db = SessionLocal()
+        try:
+            failed = database_service.fail_exhausted_jobs(db, JOB_TYPE, stale_before, settings.JOB_MAX_ATTEMPTS)
+            if failed:
+                logger.warning(f"재시도 횟수를 초과한 작업 {failed}개를 실패 처리했습니다")
+
+            job = database_service.claim_next_job(
+                db,
+                worker_id=self.worker_id,
+                job_type=JOB_TYPE,
+                stale_before=stale_before,
+                created_after=now - timedelta(hours=settings.JOB_CLAIM_MAX_AGE_HOURS),
+                max_attempts=settings.JOB_MAX_ATTEMPTS
+            )
+            if not job:
+                return False
+
+            job_id = str(job.id)
+            user_id = job.user_id
+            input_data = job.input_data or {}
+            attempts = job.attempts
+        finally:
+            db.close()
+
+        logger.info(f"📦 작업 가져옴: {job_id} (시도 {attempts}/{settings.JOB_MAX_ATTEMPTS})")
+
+        # 재시도(다른 워커가 놓친 작업)나 재개 요청으로 체크포인트가 있는 작업만 이어서 실행
+        # 첫 실행은 resume=False로 실행해야 완료된 리포트 재사용이 적용됨
+        resume = attempts > 1 or youtube_reporter_service.can_resume(job_id)
+        if resume:
+            # 이전 실행에서 남은 취소 플래그로 바로 중단되지 않도록 제거 (취소된 작업은 가져오지 않음)
+            state_manager.clear_cancelled(job_id)
+
+        with self._lock:
+            self._running_jobs.add(job_id)
+
+        future = job_executor.submit(
+            job_id,
+            youtube_reporter_service.run_job,
+            job_id=job_id,
+            user_id=user_id,
+            youtube_url=input_data.get("youtube_url"),
+            include_audio=input_data.get("include_audio", True),
+            force_refresh=input_data.get("force_refresh", False),
+            resume=resume
+        )
+        future.add_done_callback(lambda _: self._release(job_id))
+        return True
+
+    def _release(self, job_id: str):
+        with self._lock:
+            self._running_jobs.discard(job_id)
+        state_manager.clear_local_stop(job_id)
+
+    def _heartbeat_loop(self):
+        while not self._stop.is_set() or self._running_jobs:
+            with self._lock:
+                job_ids = list(self._running_jobs)
+
+            if job_ids:
+                db = SessionLocal()
+                try:
+                    for job_id in job_ids:
+                        if not database_service.heartbeat_job(db, job_id, self.worker_id):
+                            # 취소됐거나 다른 워커가 가져간 작업은 이 워커에서만 중단
+                            # (공유 취소 플래그를 설정하면 다시 가져간 워커/재개 실행까지 멈춤)
+                            logger.warning(f"작업 소유권 상실 (취소 또는 다른 워커가 가져감): {job_id}")
+                            state_manager.stop_locally(job_id)
+                except Exception as e:
+                    logger.warning(f"하트비트 갱신 실패: {e}")
+                finally:
+                    db.close()
+
+            time.sleep(settings.JOB_HEARTBEAT_INTERVAL_SECONDS)
+
+
+def main():
+    worker = AnalysisWorker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()